@@ -1,3 +1,3 @@
-from .data_loader import DataLoader
-
+from .data_loader import DataLoader
+
 __all__ = ['DataLoader']
\ No newline at end of file
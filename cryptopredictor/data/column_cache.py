@@ -0,0 +1,329 @@
+import io
+import os
+import json
+import shutil
+import hashlib
+import numpy as np
+import pandas as pd
+
+# On-disk layout of a cache directory for one source CSV:
+#   meta.json               source signature (size, mtime, content hash, head/tail window hashes), row count,
+#                           column names and kinds
+#   <id>/index.npy          row labels of the parsed, sorted frame
+#   <id>/col_<i>.npy        one array per column, dates as datetime64 in their own unit (UTC if tz-aware),
+#                           text as fixed-width unicode
+#   <id>/col_<i>.na.npy     missing-value mask for text columns that have one
+#   <id>/<group>/           derived arrays kept with the data (e.g. a feature matrix), see save_group
+# <id> is the source hash when the directory was written, so a full rewrite never touches files another
+# loader may still have memory-mapped (Windows refuses to overwrite those). Rows appended to the CSV are
+# appended to the .npy files in place instead; meta.json's row count says how many rows are valid.
+
+FORMAT_VERSION = 2
+HASH_CHUNK = 1 << 20
+WINDOW_BYTES = 1 << 20
+NEWLINES = (b'\n', b'\r')
+
+def file_signature(path):
+    # cheap change check: size and modification time in ns
+    stat = os.stat(path)
+    return {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns}
+
+def file_hash(path):
+    # content hash of a file, read in 1MB chunks
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def window_hashes(path, size):
+    # hashes of the first and the last WINDOW_BYTES of the file's first size bytes, plus the bytes either side of size
+    # O(window) whatever the file size, so telling an append from a rewrite does not read the old rows
+    #returns: ({'head': hash, 'tail': hash}, (byte before size, byte at size))
+    with open(path, 'rb') as f:
+        head = f.read(min(WINDOW_BYTES, size))
+        start = max(size - WINDOW_BYTES, 0)
+        f.seek(start)
+        tail = f.read(size - start)
+        following = f.read(1)
+    hashes = {'head': hashlib.blake2b(head, digest_size=16).hexdigest(),
+              'tail': hashlib.blake2b(tail, digest_size=16).hexdigest()}
+    return hashes, (tail[-1:], following)
+
+def cache_path(cache_dir, source):
+    # one cache directory per source file, named after the file and its absolute path
+    source = os.path.abspath(source)
+    tag = hashlib.blake2b(source.encode(), digest_size=4).hexdigest()
+    return os.path.join(cache_dir, f'{os.path.basename(source)}-{tag}')
+
+def _read_json(filename):
+    try:
+        with open(filename) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+def _write_json(filename, value):
+    # replaced atomically, readers never see a half-written file
+    tmp = filename + '.tmp'
+    with open(tmp, 'w') as f:
+        json.dump(value, f, indent=2)
+    os.replace(tmp, filename)
+
+def _read_meta(path):
+    meta = _read_json(os.path.join(path, 'meta.json'))
+    return meta if meta is not None and meta.get('format_version') == FORMAT_VERSION else None
+
+def _write_meta(path, meta):
+    # written last, a half-written cache has no meta.json and is never read
+    _write_json(os.path.join(path, 'meta.json'), meta)
+
+def check(path, source):
+    # compare the cache at path with the current contents of source
+    # size and mtime decide when they match, a touched but unchanged file is confirmed by its full hash,
+    # a longer file whose first and last cached WINDOW_BYTES hash as before only had rows appended.
+    # The append check reads two windows instead of the whole file, an edit to older rows that also grows
+    # the file is only caught when it falls inside a window.
+    #returns: dict with 'state' 'fresh', 'appended' or 'stale'; appended also has the byte 'offset' where
+    #         the new rows start and the new file 'signature'
+    meta = _read_meta(path)
+    if meta is None:
+        return {'state': 'stale'}
+    cached = meta['source']
+    current = file_signature(source)
+    if current['size'] == cached['size']:
+        if current['mtime_ns'] == cached['mtime_ns']:
+            return {'state': 'fresh'}
+        # no full hash is kept after an append, a touched file is then rebuilt rather than trusted
+        if cached.get('hash') is None or file_hash(source) != cached['hash']:
+            return {'state': 'stale'}
+        # remember the new mtime so the next load skips hashing again
+        meta['source']['mtime_ns'] = current['mtime_ns']
+        _write_meta(path, meta)
+        return {'state': 'fresh'}
+
+    if current['size'] > cached['size']:
+        windows, (last, first) = window_hashes(source, cached['size'])
+        # text added to an unterminated last line would change that row, not append one
+        if windows == cached.get('windows') and (last in NEWLINES or first in NEWLINES):
+            signature = {**current, 'hash': None, 'windows': window_hashes(source, current['size'])[0]}
+            return {'state': 'appended', 'offset': cached['size'], 'signature': signature}
+    return {'state': 'stale'}
+
+def validate(path, source):
+    # True if the cache at path was built from the current contents of source
+    return check(path, source)['state'] == 'fresh'
+
+def save_frame(path, frame, source):
+    # write frame as per-column .npy files, tagged with the signature of the source it was parsed from
+    #params: path(str): cache directory for this source, created if needed
+    #params: frame(DataFrame): parsed frame, numeric, datetime and text columns are supported
+    #params: source(str): the file frame was read from
+    signature = file_signature(source)
+    signature['hash'] = file_hash(source)
+    signature['windows'] = window_hashes(source, signature['size'])[0]
+    data_dir = os.path.join(path, signature['hash'])
+    if os.path.isdir(data_dir):
+        shutil.rmtree(data_dir)
+    os.makedirs(data_dir)
+
+    columns = []
+    for i, name in enumerate(frame.columns):
+        column = frame[name]
+        entry = {'name': name, 'file': f'col_{i}', 'kind': 'values', 'na': False, 'tz': None}
+        if isinstance(column.dtype, pd.DatetimeTZDtype):
+            values = column.dt.tz_convert('UTC').dt.tz_localize(None).to_numpy()
+            entry['tz'] = str(column.dt.tz)
+        elif (pd.api.types.is_datetime64_dtype(column) or pd.api.types.is_numeric_dtype(column)
+              or pd.api.types.is_bool_dtype(column)):
+            values = column.to_numpy()
+        else:
+            missing = column.isna().to_numpy()
+            values = np.asarray(column.where(~missing, '').astype(str).to_numpy(), dtype=str)
+            entry['kind'] = 'text'
+            if missing.any():
+                np.save(os.path.join(data_dir, f'col_{i}.na.npy'), missing)
+                entry['na'] = True
+        np.save(os.path.join(data_dir, f"{entry['file']}.npy"), np.ascontiguousarray(values))
+        columns.append(entry)
+    np.save(os.path.join(data_dir, 'index.npy'), frame.index.to_numpy())
+
+    _write_meta(path, {
+        'format_version': FORMAT_VERSION,
+        'source': {'path': os.path.abspath(source), **signature},
+        'data_dir': signature['hash'],
+        'rows': len(frame),
+        'index_name': frame.index.name,
+        'columns': columns,
+    })
+
+    # drop data written for older versions of the source, skipped while still mapped elsewhere
+    for entry in os.scandir(path):
+        if entry.is_dir() and entry.name != signature['hash']:
+            shutil.rmtree(entry.path, ignore_errors=True)
+    return path
+
+def cached_columns(path):
+    # column names of the cached frame, None if there is no cache
+    meta = _read_meta(path)
+    return [entry['name'] for entry in meta['columns']] if meta is not None else None
+
+def load_frame(path, mmap_mode='r', columns=None):
+    # the cached frame at path, check() decides whether it is still current
+    #params: mmap_mode(str): passed to np.load, numeric and date columns then stay on disk until touched
+    #params: columns(list): load only these columns, the other files are never opened
+    #returns: DataFrame, or None if there is no readable cache
+    meta = _read_meta(path)
+    if meta is None:
+        return None
+    data_dir = os.path.join(path, meta['data_dir'])
+    rows = meta['rows']
+
+    def load(name, mode=mmap_mode):
+        # files can hold rows past meta['rows'] from an append that did not finish
+        return np.load(os.path.join(data_dir, f'{name}.npy'), mmap_mode=mode)[:rows]
+
+    try:
+        data = {}
+        for entry in meta['columns']:
+            if columns is not None and entry['name'] not in columns:
+                continue
+            if entry['kind'] == 'text':
+                values = load(entry['file'], None).astype(object)
+                if entry['na']:
+                    values[load(f"{entry['file']}.na", None)] = np.nan
+                data[entry['name']] = values
+            elif entry['tz'] is not None:
+                data[entry['name']] = pd.DatetimeIndex(load(entry['file'], None)).tz_localize('UTC').tz_convert(entry['tz'])
+            else:
+                data[entry['name']] = load(entry['file'])
+        index = pd.Index(load('index', None), name=meta['index_name'])
+    except (OSError, ValueError):
+        return None
+    # copy=False keeps each memory-mapped column as its own block instead of consolidating them
+    return pd.DataFrame(data, index=index, copy=False)
+
+def _header(version, dtype, shape):
+    header = io.BytesIO()
+    write = np.lib.format.write_array_header_1_0 if version == (1, 0) else np.lib.format.write_array_header_2_0
+    write(header, {'descr': np.lib.format.dtype_to_descr(dtype), 'fortran_order': False, 'shape': shape})
+    return header.getvalue()
+
+def _plan_append(filename, values, rows):
+    # header and data offset to grow filename from rows to rows + len(values) rows, None if it cannot grow in place
+    # numpy pads .npy headers so the row count can usually be rewritten without moving the data
+    with open(filename, 'rb') as f:
+        version = np.lib.format.read_magic(f)
+        if version == (1, 0):
+            shape, fortran, dtype = np.lib.format.read_array_header_1_0(f)
+        elif version == (2, 0):
+            shape, fortran, dtype = np.lib.format.read_array_header_2_0(f)
+        else:
+            return None
+        offset = f.tell()
+    if fortran or dtype.hasobject or shape[1:] != values.shape[1:] or shape[0] < rows:
+        return None
+    if not np.can_cast(values.dtype, dtype, casting='same_kind'):
+        return None
+    header = _header(version, dtype, (rows + len(values),) + shape[1:])
+    if len(header) != offset:
+        return None
+    row_bytes = dtype.itemsize * int(np.prod(shape[1:], dtype=np.int64))
+    return header, offset + rows * row_bytes, dtype
+
+def append_arrays(directory, arrays, rows):
+    # grow every directory/<name>.npy by the rows in arrays, in place
+    # every file is checked before any is written, False means nothing was changed and the caller must rewrite
+    plans = {}
+    for name, values in arrays.items():
+        plan = _plan_append(os.path.join(directory, f'{name}.npy'), np.asarray(values), rows)
+        if plan is None:
+            return False
+        plans[name] = plan
+    for name, (header, end, dtype) in plans.items():
+        with open(os.path.join(directory, f'{name}.npy'), 'r+b') as f:
+            # rows past `rows` are left over from an append that did not finish
+            f.seek(end)
+            f.truncate()
+            f.write(np.ascontiguousarray(arrays[name], dtype=dtype).tobytes())
+            f.seek(0)
+            f.write(header)
+    return True
+
+def append_frame(path, frame, signature):
+    # append the rows of frame to the cached columns in place and record the new source signature
+    #params: frame(DataFrame): the new rows, same columns as the cache, labelled like they would be after a full parse
+    #params: signature(dict): check()['signature'] of the grown source
+    #returns: False when the rows cannot be appended (text or tz-aware columns, incompatible dtypes), nothing is changed then
+    meta = _read_meta(path)
+    if meta is None or list(frame.columns) != [entry['name'] for entry in meta['columns']]:
+        return False
+    if any(entry['kind'] != 'values' or entry['tz'] is not None for entry in meta['columns']):
+        return False
+
+    arrays = {entry['file']: frame[entry['name']].to_numpy() for entry in meta['columns']}
+    arrays['index'] = frame.index.to_numpy()
+    if not append_arrays(os.path.join(path, meta['data_dir']), arrays, meta['rows']):
+        return False
+
+    meta['source'] = {'path': meta['source']['path'], **signature}
+    meta['rows'] += len(frame)
+    _write_meta(path, meta)
+    return True
+
+def _group_dir(path, name):
+    meta = _read_meta(path)
+    return os.path.join(path, meta['data_dir'], name) if meta is not None else None
+
+def save_group(path, name, arrays, info=None, grow=()):
+    # store arrays derived from the cached data next to it, they are dropped with it when the source changes
+    #params: name(str): group name, e.g. one per feature spec
+    #params: info(dict): JSON metadata returned by load_group
+    #params: grow(tuple): names of arrays append_group extends row-wise, the others are replaced on every append
+    directory = _group_dir(path, name)
+    if directory is None:
+        raise OSError(f"No data cache at {path}")
+    os.makedirs(directory, exist_ok=True)
+    for array_name, values in arrays.items():
+        np.save(os.path.join(directory, f'{array_name}.npy'), np.ascontiguousarray(values))
+    rows = len(arrays[grow[0]]) if grow else 0
+    _write_json(os.path.join(directory, 'group.json'),
+                {'rows': rows, 'grow': list(grow), 'arrays': sorted(arrays), 'info': info or {}})
+
+def load_group(path, name, mmap_mode='r'):
+    # arrays stored by save_group, growing arrays memory-mapped
+    #returns: (arrays dict, info dict), or None if the group is missing
+    directory = _group_dir(path, name)
+    group = _read_json(os.path.join(directory, 'group.json')) if directory is not None else None
+    if group is None:
+        return None
+    try:
+        arrays = {}
+        for array_name in group['arrays']:
+            filename = os.path.join(directory, f'{array_name}.npy')
+            if array_name in group['grow']:
+                arrays[array_name] = np.load(filename, mmap_mode=mmap_mode)[:group['rows']]
+            else:
+                arrays[array_name] = np.load(filename)
+    except (OSError, ValueError):
+        return None
+    return arrays, group['info']
+
+def append_group(path, name, rows, arrays=None, info=None):
+    # append rows to the group's growing arrays in place, replace the others and update info
+    #params: rows(dict): new rows for every growing array
+    #params: arrays(dict): replacement values for non-growing arrays, small state such as window tails
+    #returns: False if the growing arrays cannot be extended in place, the group is unchanged then
+    directory = _group_dir(path, name)
+    group = _read_json(os.path.join(directory, 'group.json')) if directory is not None else None
+    if group is None or sorted(rows) != sorted(group['grow']):
+        return False
+    if not append_arrays(directory, rows, group['rows']):
+        return False
+    for array_name, values in (arrays or {}).items():
+        np.save(os.path.join(directory, f'{array_name}.npy'), np.ascontiguousarray(values))
+    group['rows'] += len(next(iter(rows.values())))
+    if info is not None:
+        group['info'] = info
+    _write_json(os.path.join(directory, 'group.json'), group)
+    return True
@@ -1,144 +1,482 @@
-import pandas as pd
-import numpy as np
-
-class DataLoader:
-    # Load and process CRYPTO data from CSV
-    
-    def __init__(self, filepath):
-        # params : filepath(str): Path to CSV
-        self.filepath = filepath
-        self.data = None
-        self.numeric_data = None
-    
-    def load_data(self):
-        # reads CSV file
-        self.data = pd.read_csv(self.filepath)
-        
-        # Check if Date column exists and sort data by date (oldest to newest)
-        if 'Date' in self.data.columns:
-            try:
-                self.data['Date'] = pd.to_datetime(self.data['Date'])
-                self.data = self.data.sort_values('Date', ascending=True)
-                print("Data sorted from oldest to newest date")
-            except:
-                print("Warning: Could not convert Date column to datetime format for sorting")
-                
-        return self.data
-    
-    def print_data_info(self):
-        # displays dataset info
-        print("Columns:", self.data.columns)
-        print("Data shape:", self.data.shape)
-        print("Data info:")
-        self.data.info()
-        print("\nData statistics:")
-        print(self.data.describe())
-    
-    def preprocess_data(self):
-        # Handle date column properly before dropping NAs
-        if 'Date' in self.data.columns:
-            try:
-                self.data['Date'] = pd.to_datetime(self.data['Date'])
-                # Ensure data is sorted by date (oldest to newest)
-                self.data = self.data.sort_values('Date', ascending=True)
-            except:
-                print("Warning: Could not convert Date column to datetime format")
-        
-        # delete n.a. columns
-        self.numeric_data = self.data.select_dtypes(include=[np.number]).dropna()
-        
-        print("\nNumeric data shape:", self.numeric_data.shape)
-        print("Numeric columns:", self.numeric_data.columns)
-        
-        # Process all potential price columns (Close, Open, High, Low)
-        price_columns = ['Close', 'Open', 'High', 'Low']
-        
-        for column in price_columns:
-            if column in self.numeric_data.columns:
-                # Add lagged values for each price column (t-1, t-2, t-3)
-                for i in range(1, 4):
-                    self.numeric_data[f'{column}_t-{i}'] = self.numeric_data[column].shift(i)
-        
-        # calc previous day volume
-        self.numeric_data['Volume_t-1'] = self.numeric_data['Volume'].shift(1)
-        
-        # Calculate moving averages for all price columns
-        for column in price_columns:
-            if column in self.numeric_data.columns:
-                self.numeric_data[f'{column}_MA_5'] = self.numeric_data[column].rolling(window=5).mean()
-                self.numeric_data[f'{column}_MA_10'] = self.numeric_data[column].rolling(window=10).mean()
-                self.numeric_data[f'{column}_Change'] = self.numeric_data[column].diff()
-        
-        # Use the default MA_5 and MA_10 as aliases for Close's moving averages for backward compatibility
-        if 'Close' in self.numeric_data.columns:
-            self.numeric_data['MA_5'] = self.numeric_data['Close_MA_5']
-            self.numeric_data['MA_10'] = self.numeric_data['Close_MA_10']
-            self.numeric_data['Price_Change'] = self.numeric_data['Close_Change']
-        
-        # delete n.a. rows
-        self.numeric_data = self.numeric_data.dropna()
-        
-        return self.numeric_data
-    
-    def split_data(self, target_column='Close', test_size=0.2, random_state=42):
-        
-        from sklearn.model_selection import train_test_split
-        
-        # Make sure target column exists in the data
-        if target_column not in self.numeric_data.columns:
-            raise ValueError(f"Target column '{target_column}' not found in dataset")
-        
-        # Create target-specific features
-        feature_columns = []
-        
-        # Add lagged values for the target
-        for i in range(1, 4):  # t-1, t-2, t-3
-            col_name = f'{target_column}_t-{i}'
-            if col_name not in self.numeric_data.columns:
-                self.numeric_data[col_name] = self.numeric_data[target_column].shift(i)
-            feature_columns.append(col_name)
-        
-        # Add common features
-        common_features = ['Volume_t-1', 'MA_5', 'MA_10', 'Price_Change']
-        for feature in common_features:
-            if feature in self.numeric_data.columns:
-                feature_columns.append(feature)
-        
-        # select relevant columns
-        X = self.numeric_data[feature_columns]
-        y = self.numeric_data[target_column]
-        
-        #split data
-        X_train, X_test, y_train, y_test = train_test_split(
-            X, y, test_size=test_size, random_state=random_state
-        )
-        
-        return X_train, X_test, y_train, y_test, feature_columns
-    
-    def get_last_days_data(self, days=365):       
-        # obtain last n data entries
-        #params: days(int): nr of days (default: 365)
-        #returns: last n days of data
-        
-        return self.data.tail(days)
-    
-    def get_data_info(self):
-        info = {
-            'rows': len(self.data),
-            'columns': len(self.data.columns),
-            'column_names': list(self.data.columns)
-        }
-        
-        # Add date range if 'Date' column exists
-        if 'Date' in self.data.columns:
-            # Ensure Date column is in datetime format
-            if not pd.api.types.is_datetime64_any_dtype(self.data['Date']):
-                date_col = pd.to_datetime(self.data['Date'])
-            else:
-                date_col = self.data['Date']
-                
-            info['date_range'] = f"{date_col.min().strftime('%Y-%m-%d')} to {date_col.max().strftime('%Y-%m-%d')}"
-        else:
-            info['date_range'] = "No date column found"
-            
-        return info
+import io
+import os
+import pandas as pd
+import numpy as np
+
+from . import column_cache
+from ..features.feature_spec import PRICE_COLUMNS, FeatureMatrix, default_spec
+
+SYMBOL_COLUMN = 'Symbol'
+CHUNK_ROWS = 250_000
+
+class DataLoader:
+    # Load and process CRYPTO data from CSV
+    # a directory of CSV files (one symbol per file) or a long-format CSV with a Symbol column holds many
+    # assets, for_symbol() then gives the single-asset loader the rest of the pipeline works on
+    
+    def __init__(self, filepath, cache_dir=None, feature_spec=None, columns=None, start=None, end=None, dtype=np.float64):
+        # params : filepath(str): Path to CSV, or a directory of <symbol>.csv files
+        # params : cache_dir(str): directory for the columnar cache of the parsed file, None always parses the CSV
+        # params : feature_spec(FeatureSpec): features to build, default_spec of the numeric columns if None
+        # params : columns(list): columns to read, Date and Symbol are always kept; None reads every column
+        # params : start, end(str or Timestamp): keep rows with start <= Date < end, either can be None
+        # params : dtype: float type of the features and numeric_data, np.float32 halves their memory;
+        #          a feature_spec passed in keeps its own dtype
+        self.filepath = filepath
+        self.cache_dir = cache_dir
+        self.feature_spec = feature_spec
+        self.columns = list(columns) if columns is not None else None
+        self.start = pd.Timestamp(start) if start is not None else None
+        self.end = pd.Timestamp(end) if end is not None else None
+        self.dtype = np.dtype(dtype)
+        self.data = None
+        self.numeric_data = None
+        self.features = None
+        self._splits = {}
+        self.from_cache = False
+        self._cache_synced = False
+        self.symbol = None
+    
+    def load_data(self):
+        # reads CSV file, or its memory-mapped columnar cache while the file is unchanged
+        # rows appended to the file since it was cached are parsed on their own and appended to the cache
+        # a directory is loaded as one long-format frame with a Symbol column
+        # columns and the [start, end) window are applied while reading: only those column files are mapped
+        # from the cache, and the CSV is parsed with usecols, stopping at the first chunk past end
+        self.from_cache = False
+        self._cache_synced = False
+        if os.path.isdir(self.filepath):
+            frames = [self.for_symbol(symbol).load_data().assign(**{SYMBOL_COLUMN: symbol}) for symbol in self.symbols()]
+            self.data = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
+            return self.data
+        
+        if self.cache_dir is not None:
+            path = self._cache_path()
+            status = column_cache.check(path, self.filepath)
+            if status['state'] == 'appended' and self._append_rows(path, status):
+                status['state'] = 'fresh'
+            if status['state'] == 'fresh':
+                cached = column_cache.load_frame(path, columns=self._usecols(column_cache.cached_columns(path)))
+                if cached is not None:
+                    self.data = self._window(cached)
+                    self.from_cache = True
+                    # features cached with the data only describe the full history
+                    self._cache_synced = self.start is None and self.end is None
+                    print("Data loaded from cache")
+                    return self.data
+        
+        # the cache holds the whole file, so building it parses everything once
+        windowed = self.cache_dir is None and (self.start is not None or self.end is not None)
+        self.data = self._read_window() if windowed else pd.read_csv(
+            self.filepath, usecols=self._usecols(self._header()) if self.cache_dir is None else None)
+        
+        # Check if Date column exists and sort data by date (oldest to newest)
+        if 'Date' in self.data.columns:
+            try:
+                self.data['Date'] = pd.to_datetime(self.data['Date'])
+                self.data = self.data.sort_values('Date', ascending=True)
+                print("Data sorted from oldest to newest date")
+            except:
+                print("Warning: Could not convert Date column to datetime format for sorting")
+        
+        if self.cache_dir is not None:
+            try:
+                column_cache.save_frame(self._cache_path(), self.data, self.filepath)
+                self._cache_synced = self.start is None and self.end is None
+            except OSError as e:
+                print(f"Warning: Could not write data cache: {e}")
+            usecols = self._usecols(list(self.data.columns))
+            self.data = self._window(self.data if usecols is None else self.data[usecols])
+                
+        return self.data
+    
+    def _header(self):
+        return list(pd.read_csv(self.filepath, nrows=0).columns)
+    
+    def _usecols(self, available):
+        # the requested columns in file order plus Date and Symbol, None when every column is wanted
+        if self.columns is None or available is None:
+            return None
+        missing = [column for column in self.columns if column not in available]
+        if missing:
+            raise ValueError(f"Columns {missing} not found in {self.filepath}")
+        return [column for column in available if column in self.columns or column in ('Date', SYMBOL_COLUMN)]
+    
+    def _window(self, frame):
+        # rows with start <= Date < end, a slice of the frame when it is in date order
+        if (self.start is None and self.end is None) or 'Date' not in frame.columns:
+            return frame
+        dates = frame['Date']
+        if dates.is_monotonic_increasing:
+            lo = dates.searchsorted(self.start) if self.start is not None else 0
+            hi = dates.searchsorted(self.end) if self.end is not None else len(frame)
+            return frame.iloc[lo:hi]
+        return frame[self._in_window(dates)]
+    
+    def _in_window(self, dates):
+        keep = np.ones(len(dates), dtype=bool)
+        if self.start is not None:
+            keep &= (dates >= self.start).to_numpy()
+        if self.end is not None:
+            keep &= (dates < self.end).to_numpy()
+        return keep
+    
+    def _read_window(self):
+        # parse the CSV in chunks with usecols, keeping rows inside the window
+        # once a file in date order passes end, the rest of it is never parsed
+        if 'Date' not in self._header():
+            raise ValueError("A start/end window needs a Date column")
+        chunks = []
+        ordered = True
+        last = None
+        for chunk in pd.read_csv(self.filepath, usecols=self._usecols(self._header()), chunksize=CHUNK_ROWS):
+            chunk['Date'] = pd.to_datetime(chunk['Date'])
+            if len(chunk):
+                ordered = ordered and chunk['Date'].is_monotonic_increasing and (last is None or chunk['Date'].iloc[0] >= last)
+                last = chunk['Date'].iloc[-1]
+            chunks.append(chunk[self._in_window(chunk['Date'])])
+            if ordered and self.end is not None and last is not None and last >= self.end:
+                break
+        return pd.concat(chunks)
+    
+    def symbols(self):
+        # assets in a directory (file names without .csv) or a long-format file (Symbol values), sorted
+        #returns: list of symbols, empty for a single-asset file
+        if os.path.isdir(self.filepath):
+            return sorted(name[:-4] for name in os.listdir(self.filepath) if name.lower().endswith('.csv'))
+        if self.data is None:
+            self.load_data()
+        if SYMBOL_COLUMN not in self.data.columns:
+            return []
+        return sorted(self.data[SYMBOL_COLUMN].dropna().unique())
+    
+    def for_symbol(self, symbol):
+        # single-asset loader for one symbol, same cache and feature settings
+        # directory symbols are read from their own file when the returned loader's load_data() runs,
+        # so worker processes each parse their own file
+        if os.path.isdir(self.filepath):
+            loader = DataLoader(os.path.join(self.filepath, f'{symbol}.csv'), self.cache_dir, self.feature_spec,
+                                self.columns, self.start, self.end, self.dtype)
+        else:
+            if self.data is None:
+                self.load_data()
+            # already projected and windowed
+            loader = DataLoader(self.filepath, None, self.feature_spec, dtype=self.dtype)
+            loader.data = self.data[self.data[SYMBOL_COLUMN] == symbol].drop(columns=SYMBOL_COLUMN)
+        loader.symbol = symbol
+        return loader
+    
+    def _cache_path(self):
+        return column_cache.cache_path(self.cache_dir, self.filepath)
+    
+    def _append_rows(self, path, status):
+        # parse only the bytes added to the CSV since it was cached and append those rows to the cache
+        #returns: False if the cache has to be rebuilt instead (new rows out of date order, incompatible types)
+        cached = column_cache.load_frame(path)
+        if cached is None:
+            return False
+        with open(self.filepath, 'rb') as f:
+            f.seek(status['offset'])
+            added = f.read()
+        try:
+            new = pd.read_csv(io.BytesIO(added), header=None, names=list(cached.columns))
+        except (ValueError, pd.errors.ParserError):
+            return False
+        # labelled like a full parse of the grown file would label them
+        new.index = pd.RangeIndex(len(cached), len(cached) + len(new))
+        
+        if 'Date' in cached.columns and pd.api.types.is_datetime64_any_dtype(cached['Date']):
+            try:
+                new['Date'] = pd.to_datetime(new['Date'])
+            except (ValueError, TypeError):
+                return False
+            if len(new) and len(cached) and (not new['Date'].is_monotonic_increasing
+                                             or new['Date'].iloc[0] < cached['Date'].iloc[-1]):
+                return False
+        
+        try:
+            appended = column_cache.append_frame(path, new, status['signature'])
+        except OSError:
+            return False
+        if appended:
+            print(f"{len(new)} new rows appended to the data cache")
+        return appended
+    
+    def print_data_info(self):
+        # displays dataset info
+        print("Columns:", self.data.columns)
+        print("Data shape:", self.data.shape)
+        print("Data info:")
+        self.data.info()
+        print("\nData statistics:")
+        print(self.data.describe())
+    
+    def preprocess_data(self):
+        # windows must not run across assets, a single-symbol file is just that asset
+        if SYMBOL_COLUMN in self.data.columns:
+            if self.data[SYMBOL_COLUMN].nunique() > 1:
+                raise ValueError("Data holds several symbols, preprocess each one from for_symbol()")
+            self.data = self.data.drop(columns=SYMBOL_COLUMN)
+        
+        # Handle date column properly before dropping NAs
+        # load_data has usually converted and sorted it already, only redo what is missing
+        if 'Date' in self.data.columns:
+            try:
+                if not pd.api.types.is_datetime64_any_dtype(self.data['Date']):
+                    self.data['Date'] = pd.to_datetime(self.data['Date'])
+                # Ensure data is sorted by date (oldest to newest)
+                if not self.data['Date'].is_monotonic_increasing:
+                    self.data = self.data.sort_values('Date', ascending=True)
+                    self._cache_synced = False
+            except:
+                print("Warning: Could not convert Date column to datetime format")
+        
+        # delete n.a. columns
+        base = self.data.select_dtypes(include=[np.number]).dropna()
+        
+        print("\nNumeric data shape:", base.shape)
+        print("Numeric columns:", base.columns)
+        
+        spec = self.feature_spec or default_spec(base.columns, dtype=self.dtype)
+        return self._compile_features(spec, base)
+    
+    def _compile_features(self, spec, base):
+        # every target's features come from one matrix, computed once from the spec
+        # with the data cache the matrix is kept on disk and only appended rows are computed
+        self.features = self._cached_features(spec, base)
+        if self.features is None:
+            self.features = spec.compile(base)
+            self._save_features(spec, base)
+        self._splits = {}
+        
+        # source columns plus features on the rows where every feature is defined
+        source = base.loc[self.features.index]
+        if spec.dtype != np.float64:
+            # the targets then match the feature matrix and everything downstream stays in spec.dtype
+            source = source.astype(spec.dtype)
+        self.numeric_data = pd.concat([source, self.features.frame()], axis=1)
+        
+        return self.numeric_data
+    
+    def _cached_features(self, spec, base):
+        # the spec's feature matrix from the data cache, rows added since it was stored are computed
+        # from the stored window tails and appended to it
+        if self.cache_dir is None or not self._cache_synced:
+            return None
+        path, name = self._cache_path(), f'features-{spec.key}'
+        group = column_cache.load_group(path, name)
+        if group is None:
+            return None
+        arrays, info = group
+        done = info['base_rows']
+        tail = pd.DataFrame(arrays['tail'], index=arrays['tail_index'], columns=info['tail_columns'])
+        # the stored rows must still be the first rows of the data
+        if done > len(base) or (len(tail) and base.index[done - 1] != tail.index[-1]):
+            return None
+        
+        if done < len(base):
+            values, index, tail = spec.extend(tail, base.iloc[done:])
+            try:
+                extended = column_cache.append_group(
+                    path, name, {'values': values, 'index': index.to_numpy()},
+                    {'tail': tail.to_numpy(), 'tail_index': tail.index.to_numpy()},
+                    {'base_rows': len(base), 'tail_columns': list(tail.columns)},
+                )
+            except OSError:
+                extended = False
+            if not extended:
+                return None
+            print(f"Features computed for {len(base) - done} new rows")
+            arrays, info = column_cache.load_group(path, name)
+        
+        return FeatureMatrix(arrays['values'], spec.columns, pd.Index(arrays['index']), spec)
+    
+    def _save_features(self, spec, base):
+        # store the matrix and window tails with the data cache so later loads skip the computation
+        if self.cache_dir is None or not self._cache_synced:
+            return
+        tail = spec.tail(base)
+        try:
+            column_cache.save_group(
+                self._cache_path(), f'features-{spec.key}',
+                {'values': self.features.values, 'index': self.features.index.to_numpy(),
+                 'tail': tail.to_numpy(), 'tail_index': tail.index.to_numpy()},
+                {'base_rows': len(base), 'tail_columns': list(tail.columns)},
+                grow=('values', 'index'),
+            )
+        except OSError as e:
+            print(f"Warning: Could not write feature cache: {e}")
+    
+    def split_features(self, test_size=0.2, random_state=42, shuffle=True):
+        # one train/test row split of the shared feature matrix, reused by every target
+        # shuffle=False keeps rows in date order, the test set is then the most recent test_size share
+        #returns: train and test FeatureMatrix
+        from sklearn.model_selection import train_test_split
+        
+        key = (test_size, random_state, shuffle)
+        if key not in self._splits:
+            train_rows, test_rows = train_test_split(
+                np.arange(len(self.features)), test_size=test_size, random_state=random_state, shuffle=shuffle
+            )
+            self._splits[key] = (self.features.rows(train_rows), self.features.rows(test_rows))
+        return self._splits[key]
+    
+    def split_data(self, target_column='Close', test_size=0.2, random_state=42, shuffle=True):
+        # shuffle=False keeps rows in date order, the test set is then the most recent test_size share
+        
+        # Make sure target column exists in the data
+        y = self.target_values(target_column)
+        
+        # target lags plus the features every target shares, as declared by the spec
+        feature_columns = self.features.spec.columns_for(target_column)
+        if any(name not in self.features.columns for name in feature_columns):
+            self._add_target(target_column)
+        
+        train, test = self.split_features(test_size, random_state, shuffle)
+        
+        return train.frame(feature_columns), test.frame(feature_columns), y.loc[train.index], y.loc[test.index], feature_columns
+    
+    def _add_target(self, target_column):
+        # numeric targets outside the spec (e.g. 'Volume', 'Adj Close') get their lags added on demand,
+        # the matrix is then compiled again from the extended spec
+        spec = self.features.spec.for_target(target_column)
+        missing = [name for name in spec.columns_for(target_column) if name not in spec.columns]
+        if self.data is None or target_column not in self.data.columns or missing:
+            # streamed features keep no source data to compile from, feature columns are no source data
+            # and custom model inputs may not be lags
+            candidates = self.numeric_data.columns if self.numeric_data is not None else self.features.columns
+            supported = [column for column in candidates
+                         if all(name in self.features.columns for name in self.features.spec.columns_for(column))]
+            raise ValueError(f"No features for target '{target_column}', supported targets are {supported}")
+        self._compile_features(spec, self.data.select_dtypes(include=[np.number]).dropna())
+    
+    def target_values(self, target_column):
+        # target_column on the feature rows, from numeric_data or the values stream_features keeps with the features
+        #returns: Series labelled like the feature matrix
+        if self.numeric_data is not None:
+            if target_column in self.numeric_data.columns:
+                return self.numeric_data[target_column]
+        elif self.features is not None and target_column in self.features.columns:
+            return self.features.frame([target_column])[target_column]
+        raise ValueError(f"Target column '{target_column}' not found in dataset")
+    
+    def stream_features(self, chunksize=500_000, out_dir=None, value_columns=PRICE_COLUMNS):
+        # build the feature matrix chunk by chunk for files too large to load, memory is bounded by chunksize
+        # rolling windows continue across chunk boundaries from the previous chunk's tail rows,
+        # the result is identical to preprocess_data on a file already in date order
+        #params: chunksize(int): CSV rows parsed at a time
+        #params: out_dir(str): write the matrix to out_dir/values.npy and index.npy and return it memory-mapped,
+        #        None fills an array preallocated from the file's line count
+        #params: value_columns(list): raw columns stored after the features, the prediction targets for split_data
+        #returns: FeatureMatrix of the spec's features followed by value_columns, also kept as self.features
+        spec = self.feature_spec
+        tail = None
+        last_date = None
+        rows = 0
+        values = labels = None
+        started = False
+        
+        for chunk in pd.read_csv(self.filepath, usecols=self._usecols(self._header()), chunksize=chunksize):
+            # the file cannot be sorted without loading it, it has to be in date order already
+            past_end = False
+            if 'Date' in chunk.columns and len(chunk):
+                dates = pd.to_datetime(chunk['Date'])
+                if not dates.is_monotonic_increasing or (last_date is not None and dates.iloc[0] < last_date):
+                    raise ValueError("stream_features needs a file sorted by Date, use load_data for unsorted files")
+                last_date = dates.iloc[-1]
+                past_end = self.end is not None and last_date >= self.end
+                chunk = chunk[self._in_window(dates)]
+            
+            if tail is None:
+                numeric_columns = list(chunk.select_dtypes(include=[np.number]).columns)
+                spec = spec or default_spec(numeric_columns, dtype=self.dtype)
+                targets = [column for column in value_columns if column in numeric_columns]
+                tail = spec.tail(pd.DataFrame(columns=numeric_columns))
+            
+            base = chunk[numeric_columns].dropna()
+            block, index, tail = spec.extend(tail, base)
+            block = np.hstack([block, base.loc[index, targets].to_numpy(dtype=spec.dtype)])
+            
+            if out_dir is None:
+                if not started:
+                    # every line but the header can hold at most one row
+                    bound = self._count_lines()
+                    values = np.empty((bound, block.shape[1]), dtype=spec.dtype)
+                    labels = np.empty(bound, dtype=np.int64)
+                values[rows:rows + len(block)] = block
+                labels[rows:rows + len(block)] = index
+            elif not started:
+                os.makedirs(out_dir, exist_ok=True)
+                np.save(os.path.join(out_dir, 'values.npy'), block)
+                np.save(os.path.join(out_dir, 'index.npy'), index.to_numpy(dtype=np.int64))
+            elif not column_cache.append_arrays(out_dir, {'values': block, 'index': index.to_numpy(dtype=np.int64)}, rows):
+                raise OSError(f"Could not append features to {out_dir}")
+            rows += len(block)
+            started = True
+            if past_end:
+                break
+        
+        if not started:
+            raise ValueError(f"No rows found in {self.filepath}")
+        if out_dir is None:
+            values, labels = values[:rows], labels[:rows]
+        else:
+            values = np.load(os.path.join(out_dir, 'values.npy'), mmap_mode='r')
+            labels = np.load(os.path.join(out_dir, 'index.npy'))
+        
+        self.features = FeatureMatrix(values, spec.columns + targets, pd.Index(labels), spec)
+        self.numeric_data = None
+        self._splits = {}
+        print(f"Streamed {rows} feature rows in chunks of {chunksize}")
+        return self.features
+    
+    def _count_lines(self):
+        # newlines in the file, read in 16MB blocks
+        count = 0
+        with open(self.filepath, 'rb') as f:
+            for block in iter(lambda: f.read(1 << 24), b''):
+                count += block.count(b'\n')
+        return count + 1
+    
+    def build_features(self, target_column='Close', lags=3, ma_windows=(5, 10)):
+        # target lags, previous volume, moving averages and price change for a chosen lag depth and MA windows
+        # lags=3, ma_windows=(5, 10) gives the same columns as split_data
+        #params: lags(int): number of target lags t-1 .. t-lags
+        #params: ma_windows(tuple): moving average windows, MAs and Price_Change follow Close like split_data
+        #returns: X(DataFrame), y(Series) on the rows where every feature is defined, labelled like numeric_data
+        base = self.data.select_dtypes(include=[np.number]).dropna()
+        if target_column not in base.columns:
+            raise ValueError(f"Target column '{target_column}' not found in dataset")
+        
+        spec = default_spec(base.columns, lags=lags, ma_windows=ma_windows, target_columns=[target_column], dtype=self.dtype)
+        features = spec.compile(base)
+        y = base[target_column].loc[features.index]
+        return features.frame(spec.columns_for(target_column)), y if spec.dtype == np.float64 else y.astype(spec.dtype)
+    
+    def get_last_days_data(self, days=365):       
+        # obtain last n data entries
+        #params: days(int): nr of days (default: 365)
+        #returns: last n days of data
+        
+        return self.data.tail(days)
+    
+    def get_data_info(self):
+        info = {
+            'rows': len(self.data),
+            'columns': len(self.data.columns),
+            'column_names': list(self.data.columns)
+        }
+        
+        # Add date range if 'Date' column exists
+        if 'Date' in self.data.columns:
+            # Ensure Date column is in datetime format
+            if not pd.api.types.is_datetime64_any_dtype(self.data['Date']):
+                date_col = pd.to_datetime(self.data['Date'])
+            else:
+                date_col = self.data['Date']
+                
+            info['date_range'] = f"{date_col.min().strftime('%Y-%m-%d')} to {date_col.max().strftime('%Y-%m-%d')}"
+        else:
+            info['date_range'] = "No date column found"
+            
+        return info
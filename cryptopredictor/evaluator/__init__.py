@@ -1,3 +1,6 @@
-from .model_evaluator import ModelEvaluator
-
-__all__ = ['ModelEvaluator']
\ No newline at end of file
+from .model_evaluator import ModelEvaluator
+from .training_scheduler import TrainingScheduler
+from .score_cache import ScoreCache
+from .batch_trainer import BatchTrainer
+
+__all__ = ['ModelEvaluator', 'TrainingScheduler', 'ScoreCache', 'BatchTrainer']
\ No newline at end of file
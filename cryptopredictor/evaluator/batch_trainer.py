@@ -0,0 +1,110 @@
+import time
+import pandas as pd
+
+from ..features.feature_processor import FeatureProcessor
+from ..features.feature_spec import PRICE_COLUMNS
+from ..forecaster.price_forecaster import PriceForecaster
+from ..model.knn_regressor import KNNRegressor
+from ..threader.threading_processor import ThreadingProcessor
+from .model_evaluator import ModelEvaluator
+
+def train_symbol(loader, targets, k_range, forecast_days, test_size=0.2, random_state=42, score_cache=None):
+    # the whole single-asset pipeline for one symbol, run as one pool task:
+    # load, features, k search, final fit, test metrics and forecast for every target
+    #params: loader(DataLoader): single-asset loader from DataLoader.for_symbol, loaded here if it has no data yet
+    #params: score_cache(ScoreCache): shared score cache, keyed per symbol and target
+    #returns: dict with the symbol's 'forecast' DataFrame and a 'scores' row per target
+    if loader.data is None:
+        loader.load_data()
+    loader.preprocess_data()
+
+    # one split and one scaling for all of the symbol's targets
+    train, test = loader.split_features(test_size, random_state)
+    shared_processor = FeatureProcessor()
+    train_scaled, test_scaled = shared_processor.scale_matrix(train, test)
+
+    forecaster = PriceForecaster()
+    last_days_data = loader.get_last_days_data()
+    forecasts = {}
+    scores = []
+    for target in [target for target in targets if target in loader.numeric_data.columns]:
+        # plain arrays from here on, the column names stay in feature_columns
+        feature_columns = loader.features.spec.columns_for(target)
+        X_train, X_test = train_scaled.take(feature_columns), test_scaled.take(feature_columns)
+        y = loader.target_values(target)
+        y_train, y_test = y.loc[train.index].to_numpy(), y.loc[test.index].to_numpy()
+
+        evaluator = ModelEvaluator(X_train, y_train).enable_sweep()
+        if score_cache is not None:
+            evaluator.enable_cache(score_cache, target=f'{loader.symbol}:{target}', feature_config=feature_columns)
+        k = evaluator.find_optimal_k(k_range)
+        model = KNNRegressor(k=k, weights=evaluator.optimal_weights).fit(X_train, y_train)
+        results = evaluator.evaluate_model(model, X_test, y_test)
+
+        forecasts[target] = forecaster.forecast(
+            model, shared_processor.for_columns(feature_columns).scaler, last_days_data, forecast_days,
+            target_column=target, feature_columns=feature_columns
+        )
+        scores.append({'Symbol': loader.symbol, 'target': target, 'k': k,
+                       **{name: value for name, value in results.items() if name != 'predictions'}})
+
+    if not forecasts:
+        raise ValueError(f"No target columns found for symbol {loader.symbol}")
+    last_date = pd.to_datetime(loader.data['Date'].values[-1]) if 'Date' in loader.data.columns else pd.Timestamp.today().normalize()
+    forecast = forecaster.create_forecast_dataframe(forecasts, last_date, list(forecasts))
+    forecast.insert(0, 'Symbol', loader.symbol)
+    return {'forecast': forecast, 'scores': scores}
+
+
+class BatchTrainer:
+    # per-symbol, per-target models for multi-asset data, one pool task per symbol
+    # symbols are independent, so the pool stays busy without splitting a symbol's k search
+
+    def __init__(self, threader=None, targets=PRICE_COLUMNS, k_range=range(1, 21), forecast_days=5,
+                 test_size=0.2, random_state=42, score_cache=None):
+        # params: threader(ThreadingProcessor): runs the symbol tasks, everything runs in-process if None
+        # params: targets(list): price columns to model for every symbol, missing ones are skipped
+        # params: score_cache(ScoreCache): reuse k search scores across runs, keyed per symbol and target
+        self.threader = threader if threader is not None else ThreadingProcessor(backend='serial')
+        self.targets = list(targets)
+        self.k_range = list(k_range)
+        self.forecast_days = forecast_days
+        self.test_size = test_size
+        self.random_state = random_state
+        self.score_cache = score_cache
+        self.forecast = None
+        self.scores = None
+        self.failed = []
+        self.throughput = None
+
+    def build_tasks(self, data_loader, symbols=None):
+        # (symbol, train_symbol, params, None) tuples for ThreadingProcessor.process_tasks
+        symbols = data_loader.symbols() if symbols is None else symbols
+        params = {'targets': self.targets, 'k_range': self.k_range, 'forecast_days': self.forecast_days,
+                  'test_size': self.test_size, 'random_state': self.random_state, 'score_cache': self.score_cache}
+        return [(symbol, train_symbol, {'loader': data_loader.for_symbol(symbol), **params}, None) for symbol in symbols]
+
+    def run(self, data_loader, symbols=None, job=None):
+        # train and forecast every symbol, symbols that fail are listed in self.failed
+        # params: data_loader(DataLoader): directory or long-format multi-asset loader
+        # params: symbols(list): subset to train, all of data_loader.symbols() if None
+        # params: job(Job): receives per-symbol progress, cancelling it stops the run with CancelledError
+        #returns: one forecast table with a Symbol column, per-target test scores are kept in self.scores
+        tasks = self.build_tasks(data_loader, symbols)
+        if not tasks:
+            raise ValueError("No symbols found, expected a directory of CSV files or a CSV with a Symbol column")
+
+        start = time.perf_counter()
+        results = self.threader.process_tasks(tasks, job)
+        elapsed = time.perf_counter() - start
+
+        done = [result for _, result in results if result is not None]
+        self.failed = [symbol for symbol, result in results if result is None]
+        self.throughput = len(done) / elapsed * 60 if elapsed > 0 else float('inf')
+        print(f"Trained {len(done)} of {len(tasks)} symbols in {elapsed:.1f}s ({self.throughput:.1f} symbols/min)")
+        if self.failed:
+            print(f"Failed symbols: {', '.join(map(str, self.failed))}")
+
+        self.forecast = pd.concat([result['forecast'] for result in done], ignore_index=True) if done else pd.DataFrame()
+        self.scores = pd.DataFrame([row for result in done for row in result['scores']])
+        return self.forecast
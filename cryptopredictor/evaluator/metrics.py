@@ -0,0 +1,24 @@
+import numpy as np
+
+# Metrics take y_true of shape (n,) or (n, 1) and y_pred of shape (n,) or (n, m)
+# and reduce over axis 0, so one call scores a whole column of k values at once
+
+def rmse(y_true, y_pred):
+    return np.sqrt(np.mean((y_pred - y_true) ** 2, axis=0))
+
+def mae(y_true, y_pred):
+    return np.mean(np.abs(y_pred - y_true), axis=0)
+
+def mape(y_true, y_pred):
+    # percentage error, y_true must not contain zeros
+    return np.mean(np.abs((y_true - y_pred) / y_true), axis=0) * 100
+
+def r2(y_true, y_pred):
+    ss_res = np.sum((y_true - y_pred) ** 2, axis=0)
+    ss_tot = np.sum((y_true - np.mean(y_true, axis=0)) ** 2, axis=0)
+    return 1 - ss_res / ss_tot
+
+DEFAULT_METRICS = {'rmse': rmse, 'r2': r2, 'mae': mae, 'mape': mape}
+
+# metrics where larger is better, everything else is an error to minimise
+HIGHER_IS_BETTER = {'r2'}
@@ -1,72 +1,575 @@
-import numpy as np
-from sklearn.model_selection import cross_val_score
-from sklearn.metrics import mean_squared_error, r2_score
-
-from ..model.knn_regressor import SKLearnKNN
-from ..threader.threading_processor import ThreadingProcessor
-
-class ModelEvaluator:
-    def __init__(self, X_train, y_train):
-        self.X_train = X_train  
-        self.y_train = y_train  
-        self.optimal_k = None   
-        self.rmse_values = []   
-        self.r2_values = []     
-        self.threader = None    
-        self.use_threading = False
-
-    def enable_threading(self, max_workers=None):
-        # enable parallel evaluation with optional max threads
-        self.use_threading = True
-        self.threader = ThreadingProcessor(max_workers=max_workers)
-        return self
-
-    def _evaluate_k(self, k):
-        # cross-validate single k, return (rmse, r2)
-        try:
-            model = SKLearnKNN(k=k)
-            rmse = -np.mean(cross_val_score(model, self.X_train, self.y_train,
-                                            scoring='neg_root_mean_squared_error', cv=5))
-            r2 = np.mean(cross_val_score(model, self.X_train, self.y_train,
-                                        scoring='r2', cv=5))
-            print(f"k={k}: RMSE={rmse:.2f}, R²={r2:.4f}")
-            return rmse, r2
-        except Exception as e:
-            print(f"Error k={k}: {e}")
-            return float('inf'), -float('inf')
-
-    def find_optimal_k(self, k_range):
-        # tune k over range, store RMSE & R2, return best k
-        print("Finding optimal k...")
-        self.rmse_values, self.r2_values = [], []
-
-        if self.use_threading and self.threader:
-            try:
-                param_list = self.threader.create_param_list('k', k_range)
-                results = self.threader.process_parallel(self._evaluate_k, param_list)
-                for _, (rmse, r2) in results:
-                    self.rmse_values.append(rmse)
-                    self.r2_values.append(r2)
-            except Exception as e:
-                print(f"Threading failed: {e}, falling back to sequential.")
-                self.use_threading = False
-                return self.find_optimal_k(k_range)
-
-        if not self.use_threading:
-            for k in k_range:
-                rmse, r2 = self._evaluate_k(k)
-                self.rmse_values.append(rmse)
-                self.r2_values.append(r2)
-
-        best_idx = np.argmin(self.rmse_values)
-        self.optimal_k = k_range[best_idx]
-        print(f"Optimal k: {self.optimal_k} (RMSE={self.rmse_values[best_idx]:.4f}, R²={self.r2_values[best_idx]:.4f})")
-        return self.optimal_k
-
-    def evaluate_model(self, model, X_test, y_test):
-        # evaluate final model, return metrics dict
-        preds = model.predict(X_test)
-        rmse = np.sqrt(mean_squared_error(y_test, preds))
-        r2 = r2_score(y_test, preds)
-        print(f"Eval (k={self.optimal_k}): RMSE={rmse:.2f}, R²={r2:.4f}")
-        return {'predictions': preds, 'rmse': rmse, 'r2': r2}
+import copy
+import json
+import math
+import itertools
+import concurrent.futures
+from collections import OrderedDict
+import numpy as np
+import pandas as pd
+from sklearn.model_selection import KFold, TimeSeriesSplit
+from sklearn.preprocessing import StandardScaler
+
+from ..model.knn_regressor import KNNRegressor, neighbor_weights
+from ..threader.threading_processor import ThreadingProcessor
+from ..threader.worker_pool import array_fingerprint
+from .metrics import DEFAULT_METRICS, HIGHER_IS_BETTER
+from .score_cache import ScoreCache
+
+class ModelEvaluator:
+    def __init__(self, X_train, y_train):
+        self.X_train = X_train  
+        self.y_train = y_train  
+        self.optimal_k = None   
+        self.rmse_values = []   
+        self.r2_values = []     
+        self.threader = None    
+        self.use_threading = False
+        self.use_sweep = False
+        self.cv_folds = 5
+        self.cv_scheme = 'kfold'
+        self.cv_window = 'expanding'
+        self.max_train_size = None
+        self.metrics = dict(DEFAULT_METRICS)
+        self.higher_is_better = set(HIGHER_IS_BETTER)
+        self.metric_values = {}
+        self.search = 'grid'
+        self.weight_schemes = ['uniform']
+        self.halving_eta = 3
+        self.halving_min_folds = 1
+        self.optimal_weights = 'uniform'
+        self.k_values = []          # k values that metric_values cover
+        self.search_results = []    # one dict per scored (k, weights, n_folds) candidate
+        self.optimal_p = 2
+        self.optimal_features = None
+        self.search_table = None
+        self.query_cache_bytes = 256 * 2 ** 20   # budget for cached fold neighbor queries
+        self._feature_cache = {}
+        self._neighbor_cache = OrderedDict()
+        self.score_cache = None
+        self.cache_target = None
+        self.cache_features = ''
+
+    def enable_threading(self, max_workers=None, pool=None, backend='process'):
+        # enable parallel evaluation with optional max threads
+        # params: pool(WorkerPool): reuse an application-owned pool instead of starting one per search
+        # params: backend(str): 'serial', 'thread', 'process' or 'auto', see ThreadingProcessor
+        self.use_threading = True
+        self.threader = ThreadingProcessor(max_workers=max_workers, pool=pool, backend=backend)
+        return self
+
+    def enable_sweep(self):
+        # score every k from one neighbor query per fold instead of one fit per k
+        self.use_sweep = True
+        return self
+
+    def enable_cache(self, cache, target=None, feature_config=None):
+        # reuse grid-search scores across runs, only k values missing from the cache are computed
+        #params: cache(ScoreCache or str): cache object or path of its SQLite file
+        #params: target(str), feature_config: labels stored with the scores, the data itself is identified by content hash
+        self.score_cache = cache if isinstance(cache, ScoreCache) else ScoreCache(cache)
+        self.cache_target = target
+        self.cache_features = json.dumps(feature_config, sort_keys=True, default=str) if feature_config is not None else ''
+        return self
+
+    def enable_halving(self, eta=3, min_folds=1, weights=('uniform',)):
+        # successive halving over (k, weights) candidates: score them all on min_folds folds, keep the best 1/eta,
+        # re-score the survivors on eta times more folds, until the last ones get the full cv_folds
+        #params: weights(tuple): weighting schemes to search alongside k, see neighbor_weights
+        if eta < 2:
+            raise ValueError("eta must be at least 2")
+        self.search = 'halving'
+        self.halving_eta = eta
+        self.halving_min_folds = max(1, min_folds)
+        self.weight_schemes = list(weights)
+        return self
+
+    def enable_golden_section(self, weights=('uniform',)):
+        # golden-section search over k for each weighting scheme, assumes RMSE is unimodal in k
+        self.search = 'golden'
+        self.weight_schemes = list(weights)
+        return self
+
+    def enable_loo(self):
+        # exact leave-one-out: one index over the training set and one self-query of max(k)+1 neighbors, no refits
+        # counts as a single fold, so halving has nothing to subsample and scores every candidate once
+        # metrics are pooled over all held-out points (RMSE = sqrt(mean squared LOO error)); averaging per-row
+        # fold scores like cross_val_score(cv=LeaveOneOut()) would turn RMSE into MAE instead
+        self.cv_scheme = 'loo'
+        self.cv_folds = 1
+        self.cv_window = 'expanding'
+        self.max_train_size = None
+        return self
+
+    def enable_walk_forward(self, n_splits=5, window='expanding', max_train_size=None):
+        # time-ordered CV, each fold trains on the past and tests on the next block of rows
+        #params: window(str): 'expanding' keeps all history, 'sliding' keeps the last max_train_size rows
+        #note: X_train/y_train must be in time order, e.g. from split_data(shuffle=False)
+        if window not in ('expanding', 'sliding'):
+            raise ValueError(f"Unknown window '{window}', expected 'expanding' or 'sliding'")
+        if window == 'sliding' and not max_train_size:
+            raise ValueError("A sliding window needs max_train_size")
+        self.cv_scheme = 'walk_forward'
+        self.cv_folds = n_splits
+        self.cv_window = window
+        self.max_train_size = max_train_size if window == 'sliding' else None
+        return self
+
+    def add_metric(self, name, func, higher_is_better=False):
+        # register an extra metric, func(y_true, y_pred) must reduce over axis 0
+        self.metrics[name] = func
+        if higher_is_better:
+            self.higher_is_better.add(name)
+        else:
+            self.higher_is_better.discard(name)
+        return self
+
+    def _worst_score(self, name):
+        return -np.inf if name in self.higher_is_better else np.inf
+
+    @staticmethod
+    def _query_size(ks, n_train):
+        # largest k that the fold can answer
+        valid = ks[ks <= n_train]
+        return int(valid.max()) if len(valid) else 1
+
+    def _splits(self, X):
+        # (train_idx, test_idx) pairs of the configured CV scheme
+        if self.cv_scheme == 'walk_forward':
+            return TimeSeriesSplit(n_splits=self.cv_folds, max_train_size=self.max_train_size).split(X)
+        # same contiguous splits as cross_val_score(cv=5)
+        return KFold(n_splits=self.cv_folds).split(X)
+
+    def _kfold_neighbors(self, X, y, ks, folds=None, p=2):
+        # one fresh index per fold, folds limits the run to those fold numbers
+        # walk-forward folds too, a tree build is cheap next to the fold's queries and those are fastest
+        # against a single index (a partial_fit-grown or per-block index measured 2.5-11x slower)
+        for fold, (train_idx, test_idx) in enumerate(self._splits(X)):
+            if folds is not None and fold not in folds:
+                continue
+            model = KNNRegressor(k=self._query_size(ks, len(train_idx)), p=p).fit(X[train_idx], y[train_idx])
+            distances, indices = model.kneighbors(X[test_idx])
+            yield test_idx, y[train_idx][indices], distances, len(train_idx)
+
+    def _loo_neighbors(self, X, y, ks, folds=None, p=2):
+        # every row queried against the full index, its own match dropped from the max(k)+1 results
+        # all rows come back as one fold, so metrics are pooled over every held-out point
+        if folds is not None and 0 not in folds:
+            return
+        n = len(X)
+        k_query = self._query_size(ks, n - 1)
+        model = KNNRegressor(k=k_query + 1, p=p).fit(X, y)
+        distances, indices = model.kneighbors(X)
+
+        is_self = indices == np.arange(n)[:, None]
+        # among exact duplicates the row itself can rank past k+1, then one of its zero-distance twins is dropped
+        is_self[~is_self.any(axis=1), -1] = True
+        keep = ~is_self
+        indices = indices[keep].reshape(n, k_query)
+        distances = distances[keep].reshape(n, k_query)
+        yield np.arange(n), y[indices], distances, n - 1
+
+    def _training_arrays(self):
+        X = self.X_train.values if hasattr(self.X_train, "values") else np.asarray(self.X_train)
+        y = self.y_train.values if hasattr(self.y_train, "values") else np.asarray(self.y_train)
+        return X, y
+
+    def _without_data(self):
+        # shallow copy that pickles without the training set, workers get it from shared memory instead
+        light = copy.copy(self)
+        light.X_train, light.y_train, light.threader = None, None, None
+        light._feature_cache, light._neighbor_cache, light.score_cache = {}, OrderedDict(), None
+        return light
+
+    def _cross_validate(self, k_values, X_train=None, y_train=None, weights='uniform', folds=None):
+        # one fit and one max(k) query per fold, every metric and every k scored from the same predictions
+        return self._cross_validate_schemes(k_values, [weights], X_train, y_train, folds)[weights]
+
+    def _cross_validate_schemes(self, k_values, schemes, X_train=None, y_train=None, folds=None, p=2, cache_key=None):
+        # _cross_validate for several weighting schemes, they all share each fold's neighbor query
+        #params: cache_key: identifies X_train/y_train, the fold queries are then cached and reused for k up to the cached max
+        #returns: {scheme: {metric: scores per k}}
+        X, y = (X_train, y_train) if X_train is not None else self._training_arrays()
+        ks = np.asarray(k_values, dtype=int)
+        fold_scores = {scheme: {name: [] for name in self.metrics} for scheme in schemes}
+
+        for test_idx, neighbor_targets, distances, n_train in self._fold_neighbors(X, y, ks, folds, p, cache_key):
+            for scheme in schemes:
+                scores = self._score_fold(ks, y[test_idx], neighbor_targets, n_train, distances, scheme)
+                for name, values in scores.items():
+                    fold_scores[scheme][name].append(values)
+
+        return {scheme: {name: np.mean(values, axis=0) for name, values in scores.items()}
+                for scheme, scores in fold_scores.items()}
+
+    def _fold_neighbors(self, X, y, ks, folds=None, p=2, cache_key=None):
+        # per-fold (test_idx, neighbor targets, distances, n_train), extra neighbor columns beyond max(ks) are harmless
+        neighbors = self._loo_neighbors if self.cv_scheme == 'loo' else self._kfold_neighbors
+        if cache_key is None:
+            return neighbors(X, y, ks, folds, p)
+
+        key = (cache_key, p, self.cv_scheme, self.cv_folds, self.max_train_size, tuple(folds) if folds is not None else None)
+        cached = self._neighbor_cache.get(key)
+        if cached is not None and cached[0] >= ks.max():
+            self._neighbor_cache.move_to_end(key)
+            return cached[1]
+
+        fold_neighbors = list(neighbors(X, y, ks, folds, p))
+        size = sum(test_idx.nbytes + targets.nbytes + distances.nbytes for test_idx, targets, distances, _ in fold_neighbors)
+        self._neighbor_cache[key] = (int(ks.max()), fold_neighbors, size)
+        # least recently used queries go first, the newest one is kept even if it alone is over budget
+        while len(self._neighbor_cache) > 1 and sum(entry[2] for entry in self._neighbor_cache.values()) > self.query_cache_bytes:
+            self._neighbor_cache.popitem(last=False)
+        return fold_neighbors
+
+    def _score_fold(self, ks, y_test, neighbor_targets, n_train, distances=None, weights='uniform'):
+        # every metric for every k from one fold's nearest-first neighbor targets
+        y_true = y_test[:, None]
+        valid = ks <= n_train
+        k_valid = np.where(valid, ks, 1)
+        preds = self._sweep_predictions(k_valid, neighbor_targets, distances, weights)
+
+        return {name: np.where(valid, func(y_true, preds), self._worst_score(name))
+                for name, func in self.metrics.items()}
+
+    @staticmethod
+    def _sweep_predictions(ks, neighbor_targets, distances, weights):
+        # one prediction column per k from nearest-first neighbors, matches KNNRegressor(k, weights).predict
+        if weights == 'uniform':
+            # column j holds the sum of the j+1 nearest targets
+            cum_targets = np.cumsum(neighbor_targets, axis=1)
+            return cum_targets[:, ks - 1] / ks
+
+        if weights == 'distance':
+            # inverse distance weights do not depend on k, so running sums still give every k at once
+            w = neighbor_weights(distances, weights)
+            return np.cumsum(w * neighbor_targets, axis=1)[:, ks - 1] / np.cumsum(w, axis=1)[:, ks - 1]
+
+        # gaussian (bandwidth = k-th distance) and callable weights change with k
+        preds = np.empty((len(neighbor_targets), len(ks)))
+        for j, k in enumerate(ks):
+            w = neighbor_weights(distances[:, :k], weights)
+            preds[:, j] = (w * neighbor_targets[:, :k]).sum(axis=1) / w.sum(axis=1)
+        return preds
+
+    def _fold_scores(self, fold, k_values, X_train=None, y_train=None):
+        # score one fold on a fresh index, the unit of work handed out by TrainingScheduler
+        X, y = (X_train, y_train) if X_train is not None else self._training_arrays()
+        ks = np.asarray(k_values, dtype=int)
+        (test_idx, neighbor_targets, distances, n_train), = self._fold_neighbors(X, y, ks, [fold])
+        return self._score_fold(ks, y[test_idx], neighbor_targets, n_train, distances)
+
+    def _evaluate_k(self, k, X_train=None, y_train=None):
+        # cross-validate single k, return {metric: score}
+        try:
+            scores = {name: float(values[0]) for name, values in self._cross_validate([k], X_train, y_train).items()}
+            print(f"k={k}: RMSE={scores['rmse']:.2f}, R²={scores['r2']:.4f}")
+            return scores
+        except Exception as e:
+            print(f"Error k={k}: {e}")
+            return {name: self._worst_score(name) for name in self.metrics}
+
+    def _sweep_k(self, k_range):
+        # all k values in a single pass over the folds
+        scores = self._cross_validate(k_range)
+        for i, k in enumerate(k_range):
+            print(f"k={k}: RMSE={scores['rmse'][i]:.2f}, R²={scores['r2'][i]:.4f}")
+        return [{name: float(values[i]) for name, values in scores.items()} for i in range(len(k_range))]
+
+    def find_optimal_k(self, k_range, job=None):
+        # tune k over range, store every metric per k, return best k by RMSE
+        # params: job(Job): receives progress per k (per sweep when use_sweep), cancelling it raises CancelledError
+        print("Finding optimal k...")
+
+        if self.search == 'halving':
+            return self._halving_search(k_range, job)
+        if self.search == 'golden':
+            return self._golden_search(k_range, job)
+
+        # only the k values missing from the score cache are computed
+        scores = self._cached_scores(k_range)
+        if scores:
+            print(f"{len(scores)} of {len(k_range)} k values loaded from the score cache")
+        missing = [k for k in k_range if k not in scores]
+        if missing:
+            results = self._score_k_values(missing, job)
+            self._store_scores(missing, results)
+            scores.update(zip(missing, results))
+
+        return self._select_k(k_range, [scores[k] for k in k_range])
+
+    def _score_k_values(self, k_range, job=None):
+        # one {metric: score} dict per k, from the sweep, the worker pool or one k at a time
+        results = None
+        if self.use_sweep:
+            if job is not None:
+                job.add_total(1)
+            results = self._sweep_k(k_range)
+            if job is not None:
+                job.advance()
+        elif self.use_threading and self.threader:
+            try:
+                param_list = self.threader.create_param_list('k', k_range)
+                X, y = self._training_arrays()
+                results = [scores for _, scores in self.threader.process_parallel(
+                    self._without_data()._evaluate_k, param_list, shared_arrays={'X_train': X, 'y_train': y}, job=job)]
+                if any(scores is None for scores in results):
+                    raise RuntimeError("a worker returned no scores")
+            except concurrent.futures.CancelledError:
+                raise
+            except Exception as e:
+                print(f"Threading failed: {e}, falling back to sequential.")
+                self.use_threading = False
+                return self._score_k_values(k_range, job)
+
+        if results is None:
+            if job is not None:
+                job.add_total(len(k_range))
+            results = []
+            for k in k_range:
+                if job is not None:
+                    job.raise_if_cancelled()
+                results.append(self._evaluate_k(k))
+                if job is not None:
+                    job.advance()
+        return results
+
+    def _cache_key(self, weights='uniform', n_folds=None, p=2, dataset=None):
+        # (dataset, target, features, cv, weights) row key of the score cache
+        #params: n_folds(int): scored on the last n_folds folds only (halving rungs), None for all of them
+        #params: dataset(str): fingerprint from _dataset_fingerprint, of the evaluator's own arrays if None
+        cv = f"{self.cv_scheme}:{self.cv_folds}:{self.cv_window}:{self.max_train_size}"
+        if n_folds is not None and n_folds != self.cv_folds:
+            cv += f":last={n_folds}"
+        if p != 2:
+            cv += f":p={p}"
+        if dataset is None:
+            dataset = self._dataset_fingerprint(*self._training_arrays())
+        return (dataset, str(self.cache_target), self.cache_features, cv, str(weights))
+
+    @staticmethod
+    def _dataset_fingerprint(X, y):
+        return array_fingerprint(X) + array_fingerprint(y)
+
+    def _cached_scores(self, k_range, key=None):
+        # {k: {metric: score}} already in the score cache
+        if self.score_cache is None:
+            return {}
+        return self.score_cache.get(key or self._cache_key(), k_range, list(self.metrics))
+
+    def _store_scores(self, k_values, results, key=None):
+        # ks whose RMSE failed or is out of range (non-finite) are left out so a later run retries them,
+        # other metrics may be NaN or inf (MAPE on zero targets, R² of a constant fold) and are cached as they are
+        if self.score_cache is None:
+            return
+        finite = [(k, scores) for k, scores in zip(k_values, results) if np.isfinite(scores['rmse'])]
+        if finite:
+            self.score_cache.put(key or self._cache_key(), *zip(*finite))
+
+    def _cross_validate_cached(self, k_values, schemes, X_train=None, y_train=None, n_folds=None, p=2, cache_key=None):
+        # _cross_validate_schemes on the last n_folds folds, (k, scheme) pairs in the score cache are not scored again
+        #returns: {scheme: {metric: scores per k}}
+        n_folds = self.cv_folds if n_folds is None else n_folds
+        folds = range(self.cv_folds - n_folds, self.cv_folds)
+        if self.score_cache is None:
+            return self._cross_validate_schemes(k_values, schemes, X_train, y_train, folds, p, cache_key)
+
+        X, y = (X_train, y_train) if X_train is not None else self._training_arrays()
+        dataset = self._dataset_fingerprint(X, y)
+        keys = {scheme: self._cache_key(scheme, n_folds, p, dataset) for scheme in schemes}
+        scores = {scheme: self._cached_scores(k_values, keys[scheme]) for scheme in schemes}
+
+        # one shared pass for every k that any scheme is missing
+        missing = [k for k in k_values if any(k not in scores[scheme] for scheme in schemes)]
+        if missing:
+            fresh = self._cross_validate_schemes(missing, schemes, X, y, folds, p, cache_key)
+            for scheme in schemes:
+                results = [{name: float(values[i]) for name, values in fresh[scheme].items()} for i in range(len(missing))]
+                self._store_scores(missing, results, keys[scheme])
+                scores[scheme].update(zip(missing, results))
+
+        return {scheme: {name: np.array([scores[scheme][k][name] for k in k_values]) for name in self.metrics}
+                for scheme in schemes}
+
+    def _select_k(self, k_range, results):
+        # store per-k scores (one {metric: score} dict per k) and pick the k with the lowest RMSE
+        self.metric_values = {name: [scores[name] for scores in results] for name in self.metrics}
+        self.rmse_values = self.metric_values['rmse']
+        self.r2_values = self.metric_values['r2']
+        self.k_values = list(k_range)
+        self.search_results = [{'k': k, 'weights': 'uniform', 'n_folds': self.cv_folds, **scores}
+                               for k, scores in zip(k_range, results)]
+
+        best_idx = np.argmin(self.rmse_values)
+        self.optimal_k = k_range[best_idx]
+        self.optimal_weights = 'uniform'
+        print(f"Optimal k: {self.optimal_k} (RMSE={self.rmse_values[best_idx]:.4f}, R²={self.r2_values[best_idx]:.4f})")
+        return self.optimal_k
+
+    def _score_candidates(self, candidates, n_folds):
+        # score (k, weights) pairs on the last n_folds folds (the largest training sets under walk-forward)
+        ks = sorted({k for k, _ in candidates})
+        schemes = list(dict.fromkeys(w for _, w in candidates))
+        scores = self._cross_validate_cached(ks, schemes, n_folds=n_folds)
+        position = {k: i for i, k in enumerate(ks)}
+        return [{'k': k, 'weights': w, 'n_folds': n_folds,
+                 **{name: float(values[position[k]]) for name, values in scores[w].items()}}
+                for k, w in candidates]
+
+    def _halving_search(self, k_range, job=None):
+        # successive halving, the number of folds is the resource that grows for the survivors
+        schedule = [min(self.halving_min_folds, self.cv_folds)]
+        while schedule[-1] < self.cv_folds:
+            schedule.append(min(self.cv_folds, schedule[-1] * self.halving_eta))
+        if job is not None:
+            job.add_total(len(schedule))
+
+        candidates = [(k, w) for w in self.weight_schemes for k in k_range]
+        rows = []
+        for rung, n_folds in enumerate(schedule):
+            if job is not None:
+                job.raise_if_cancelled()
+            scored = self._score_candidates(candidates, n_folds)
+            rows.extend(scored)
+            print(f"Rung {rung}: {len(candidates)} candidates on {n_folds}/{self.cv_folds} folds")
+            keep = max(1, math.ceil(len(scored) / self.halving_eta))
+            candidates = [(row['k'], row['weights']) for row in sorted(scored, key=lambda row: row['rmse'])[:keep]]
+            if job is not None:
+                job.advance()
+
+        return self._select_candidates(rows)
+
+    def _golden_search(self, k_range, job=None):
+        # golden-section search over the sorted k_range for each scheme, every probe is a full cross-validation
+        ks = sorted(k_range)
+        inv_phi = (math.sqrt(5) - 1) / 2
+        rows = {}
+        if job is not None:
+            job.add_total(len(self.weight_schemes))
+
+        def probe(scheme, positions):
+            # score the positions not seen yet in one shared pass
+            new = [ks[i] for i in positions if (ks[i], scheme) not in rows]
+            if new:
+                for row in self._score_candidates([(k, scheme) for k in new], self.cv_folds):
+                    rows[(row['k'], scheme)] = row
+            return [rows[(ks[i], scheme)]['rmse'] for i in positions]
+
+        for scheme in self.weight_schemes:
+            if job is not None:
+                job.raise_if_cancelled()
+            lo, hi = 0, len(ks) - 1
+            while hi - lo > 2:
+                step = int(round((hi - lo) * inv_phi))
+                c, d = hi - step, lo + step
+                rmse_c, rmse_d = probe(scheme, [c, d])
+                if rmse_c <= rmse_d:
+                    hi = d
+                else:
+                    lo = c
+            probe(scheme, range(lo, hi + 1))
+            print(f"Golden section ({scheme}): {sum(1 for _, w in rows if w == scheme)} of {len(ks)} k values scored")
+            if job is not None:
+                job.advance()
+
+        return self._select_candidates(list(rows.values()))
+
+    def _select_candidates(self, rows):
+        # pick the fully cross-validated candidate with the lowest RMSE
+        # metric_values/k_values then follow its other settings (weights, p, features) over every k they were fully scored on
+        self.search_results = rows
+        full = [row for row in rows if row['n_folds'] == self.cv_folds]
+        best = min(full, key=lambda row: row['rmse'])
+        settings = [key for key in best if key not in ('k', 'n_folds') and key not in self.metrics]
+        curve = sorted((row for row in full if all(row[key] == best[key] for key in settings)), key=lambda row: row['k'])
+
+        self.k_values = [row['k'] for row in curve]
+        self.metric_values = {name: [row[name] for row in curve] for name in self.metrics}
+        self.rmse_values = self.metric_values['rmse']
+        self.r2_values = self.metric_values['r2']
+        self.optimal_k = best['k']
+        self.optimal_weights = best['weights']
+        self.optimal_p = best.get('p', 2)
+        if 'lags' in best:
+            self.optimal_features = {'lags': best['lags'], 'ma_windows': best['ma_windows']}
+        print(f"Optimal k: {self.optimal_k}, weights={self.optimal_weights} (RMSE={best['rmse']:.4f}, R²={best['r2']:.4f})")
+        return self.optimal_k
+
+    def search_hyperparameters(self, k_range, weights=('uniform',), p_values=(2,), lags=(3,), ma_windows=((5, 10),),
+                               feature_builder=None, train_index=None, job=None):
+        # joint grid over k, weighting, Minkowski p, lag depth and MA windows
+        # each (features, p) pair costs one index and one max(k) query per fold, every k and weighting is scored from it
+        #params: feature_builder(callable): feature_builder(lags=..., ma_windows=...) -> (X, y) over the full history,
+        #        e.g. functools.partial(data_loader.build_features, 'Close'); rows are matched to y_train by index label.
+        #        Without it lags/ma_windows are ignored and the evaluator's own features are searched
+        #params: train_index: labels of the training rows, needed with feature_builder when y_train is a plain array
+        #returns: DataFrame with one row per (lags, ma_windows, p, weights, k) and every metric, best RMSE first
+        configs = list(itertools.product(lags, [tuple(w) for w in ma_windows])) if feature_builder else [(None, None)]
+        datasets = self._feature_sets(configs, feature_builder, train_index)
+        if job is not None:
+            job.add_total(len(configs) * len(p_values))
+
+        rows = []
+        for (n_lags, windows), p in itertools.product(configs, p_values):
+            if job is not None:
+                job.raise_if_cancelled()
+            X, y = datasets[(n_lags, windows)]
+            scores = self._cross_validate_cached(k_range, list(weights), X, y, p=p,
+                                                 cache_key=(feature_builder, n_lags, windows))
+            for scheme in weights:
+                for i, k in enumerate(k_range):
+                    rows.append({'lags': n_lags, 'ma_windows': windows, 'p': p, 'weights': scheme, 'k': k,
+                                 'n_folds': self.cv_folds,
+                                 **{name: float(values[i]) for name, values in scores[scheme].items()}})
+            print(f"lags={n_lags}, ma_windows={windows}, p={p}: best RMSE={min(scores[w]['rmse'].min() for w in weights):.4f}")
+            if job is not None:
+                job.advance()
+
+        self._select_candidates(rows)
+        self.search_table = (pd.DataFrame(rows).drop(columns='n_folds')
+                             .sort_values('rmse', kind='stable').reset_index(drop=True))
+        return self.search_table
+
+    def _feature_sets(self, configs, feature_builder, train_index=None):
+        # scaled training matrices per (lags, ma_windows), cached, all restricted to the rows every config defines
+        if feature_builder is None:
+            return {(None, None): self._training_arrays()}
+
+        # only training rows, the built features also cover the test split
+        if train_index is not None:
+            labels = pd.Index(train_index)
+        elif hasattr(self.y_train, 'index'):
+            labels = self.y_train.index
+        else:
+            raise ValueError("feature_builder needs the training row labels, pass y_train as a Series or train_index")
+
+        built = {}
+        for config in configs:
+            key = (feature_builder, config)
+            if key not in self._feature_cache:
+                n_lags, windows = config
+                self._feature_cache[key] = feature_builder(lags=n_lags, ma_windows=windows)
+            built[config] = self._feature_cache[key]
+
+        # longer lags and windows need more warm-up rows, compare every config on the same rows
+        common = None
+        for X, _ in built.values():
+            common = X.index if common is None else common.intersection(X.index)
+        rows = labels[labels.isin(common)]
+        if len(rows) == 0:
+            raise ValueError("No training rows in common with the built features, check that y_train keeps its index")
+
+        datasets = {}
+        for config, (X, y) in built.items():
+            X_rows = X.loc[rows].values
+            datasets[config] = (StandardScaler().fit_transform(X_rows), np.asarray(y.loc[rows]))
+        return datasets
+
+    def evaluate_model(self, model, X_test, y_test):
+        # evaluate final model, return predictions plus every registered metric
+        preds = model.predict(X_test)
+        y_true = y_test.values if hasattr(y_test, "values") else np.asarray(y_test)
+        results = {'predictions': preds}
+        for name, func in self.metrics.items():
+            results[name] = float(func(y_true, preds))
+        print(f"Eval (k={self.optimal_k}): RMSE={results['rmse']:.2f}, R²={results['r2']:.4f}")
+        return results
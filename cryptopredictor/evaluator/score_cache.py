@@ -0,0 +1,79 @@
+import os
+import sqlite3
+import contextlib
+import numpy as np
+
+# One row per (dataset, target, features, cv, weights, k, metric):
+#   dataset    content hash of the training arrays, so edited data never hits old scores
+#   target     target column label
+#   features   feature configuration label (e.g. the feature column list)
+#   cv         CV scheme with its settings
+#   weights    neighbor weighting scheme
+# The cv label also carries the fold subset of a halving rung and a non-euclidean Minkowski p, so every
+# search strategy shares the table with one row per (k, weights, n_folds, p).
+# Metrics are stored by name; registering a different function under an existing name needs clear().
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS scores (
+    dataset TEXT NOT NULL,
+    target TEXT NOT NULL,
+    features TEXT NOT NULL,
+    cv TEXT NOT NULL,
+    weights TEXT NOT NULL,
+    k INTEGER NOT NULL,
+    metric TEXT NOT NULL,
+    value REAL NOT NULL,
+    PRIMARY KEY (dataset, target, features, cv, weights, k, metric)
+)
+"""
+
+class ScoreCache:
+    # persistent cross-validation scores in a SQLite file, safe to share between threads and runs
+
+    def __init__(self, path):
+        # params: path(str): database file, created with its directory if needed
+        self.path = path
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute(SCHEMA)
+
+    @contextlib.contextmanager
+    def _connect(self):
+        # a short-lived connection per call, sqlite3 connections cannot cross threads
+        conn = sqlite3.connect(self.path, timeout=30)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def get(self, key, k_values, metrics):
+        # cached scores for k_values under key (dataset, target, features, cv, weights)
+        #returns: {k: {metric: value}} for the ks that have every requested metric
+        k_values = [int(k) for k in k_values]
+        found = {}
+        with self._connect() as conn:
+            for start in range(0, len(k_values), 500):
+                chunk = k_values[start:start + 500]
+                rows = conn.execute(
+                    "SELECT k, metric, value FROM scores WHERE dataset=? AND target=? AND features=? AND cv=? AND weights=?"
+                    f" AND k IN ({','.join('?' * len(chunk))})",
+                    (*key, *chunk),
+                )
+                for k, metric, value in rows:
+                    found.setdefault(k, {})[metric] = float(value)
+        return {k: {name: scores[name] for name in metrics}
+                for k, scores in found.items() if all(name in scores for name in metrics)}
+
+    def put(self, key, k_values, results):
+        # store one {metric: value} dict per k
+        # NaN (e.g. R² of a constant fold) is kept as the text 'nan', sqlite3 would turn a NaN REAL into NULL
+        rows = [(*key, int(k), name, 'nan' if np.isnan(value) else float(value))
+                for k, scores in zip(k_values, results) for name, value in scores.items()]
+        with self._connect() as conn:
+            conn.executemany("INSERT OR REPLACE INTO scores VALUES (?, ?, ?, ?, ?, ?, ?, ?)", rows)
+
+    def clear(self):
+        with self._connect() as conn:
+            conn.execute("DELETE FROM scores")
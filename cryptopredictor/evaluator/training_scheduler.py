@@ -0,0 +1,103 @@
+import os
+import numpy as np
+
+class TrainingScheduler:
+    # k search for several targets as one flat list of (target, fold, k block) tasks, so the pool
+    # stays busy even when k_range is shorter than the number of cores
+
+    def __init__(self, threader=None):
+        # params: threader(ThreadingProcessor): runs the tasks, everything runs in-process if None
+        self.threader = threader
+        self.evaluators = {}
+
+    def add_target(self, target, evaluator):
+        # params: evaluator(ModelEvaluator): holds the target's training data and CV settings
+        self.evaluators[target] = evaluator
+        return self
+
+    def _n_workers(self):
+        if self.threader is None:
+            return 1
+        if self.threader.pool is not None and self.threader.pool.max_workers:
+            return self.threader.pool.max_workers
+        return self.threader.max_workers or os.cpu_count() or 1
+
+    def _grid_evaluators(self):
+        # halving and golden-section searches pick their next candidates from earlier scores, they run on their own
+        return {target: evaluator for target, evaluator in self.evaluators.items() if evaluator.search == 'grid'}
+
+    def _k_blocks(self, k_range):
+        # split k_range only as far as needed for about two tasks per worker
+        n_fold_tasks = max(1, sum(evaluator.cv_folds for evaluator in self._grid_evaluators().values()))
+        n_blocks = min(len(k_range), max(1, -(-2 * self._n_workers() // n_fold_tasks)))
+        return [list(block) for block in np.array_split(np.asarray(k_range), n_blocks)]
+
+    def build_tasks(self, k_range, pending=None):
+        # (key, func, params, shared_arrays) tuples, most expensive first so stragglers start early
+        # params: pending(dict): target -> k values still to score, all of k_range for every target if None
+        tasks = []
+        for target, evaluator in self._grid_evaluators().items():
+            ks = k_range if pending is None else pending[target]
+            if not len(ks):
+                continue
+            blocks = self._k_blocks(ks)
+            X, y = evaluator._training_arrays()
+            arrays = {'X_train': X, 'y_train': y}
+            light = evaluator._without_data()
+            for fold in range(evaluator.cv_folds):
+                for b, block in enumerate(blocks):
+                    cost = len(X) * max(block)
+                    tasks.append((cost, ((target, fold, b), light._fold_scores, {'fold': fold, 'k_values': block}, arrays)))
+        tasks.sort(key=lambda task: -task[0])
+        return [task for _, task in tasks]
+
+    def run(self, k_range, job=None):
+        # score every target, store results on each evaluator, return {target: optimal_k}
+        # params: job(Job): receives per-task progress, cancelling it stops the search with CancelledError
+        # ks already in an evaluator's score cache are not scheduled again
+        cached = {target: evaluator._cached_scores(k_range) for target, evaluator in self._grid_evaluators().items()}
+        pending = {target: [k for k in k_range if k not in scores] for target, scores in cached.items()}
+        for target, scores in cached.items():
+            if scores:
+                print(f"{target}: {len(scores)} of {len(k_range)} k values loaded from the score cache")
+        tasks = self.build_tasks(k_range, pending)
+        if self.threader is None:
+            if job is not None:
+                job.add_total(len(tasks))
+            results = []
+            for key, func, params, arrays in tasks:
+                if job is not None:
+                    job.raise_if_cancelled()
+                results.append((key, func(**arrays, **params)))
+                if job is not None:
+                    job.advance()
+        else:
+            results = self.threader.process_tasks(tasks, job)
+
+        fold_blocks = {}
+        for (target, fold, block), scores in results:
+            if scores is None:
+                raise RuntimeError(f"Task failed for target {target}, fold {fold}")
+            fold_blocks.setdefault(target, {}).setdefault(fold, {})[block] = scores
+
+        optimal = {}
+        for target, evaluator in self.evaluators.items():
+            if evaluator.search != 'grid':
+                optimal[target] = evaluator.find_optimal_k(k_range, job)
+                continue
+            scores = cached[target]
+            if pending[target]:
+                # stitch k blocks back together per fold, then average over folds like _cross_validate
+                per_fold = [
+                    {name: np.concatenate([blocks[b][name] for b in sorted(blocks)]) for name in evaluator.metrics}
+                    for blocks in fold_blocks[target].values()
+                ]
+                mean_scores = {name: np.mean([fold[name] for fold in per_fold], axis=0) for name in evaluator.metrics}
+                new_scores = [{name: float(values[i]) for name, values in mean_scores.items()} for i in range(len(pending[target]))]
+                evaluator._store_scores(pending[target], new_scores)
+                scores.update(zip(pending[target], new_scores))
+            print(f"\n{target}:")
+            for k in k_range:
+                print(f"k={k}: RMSE={scores[k]['rmse']:.2f}, R²={scores[k]['r2']:.4f}")
+            optimal[target] = evaluator._select_k(k_range, [scores[k] for k in k_range])
+        return optimal
@@ -1,3 +1,4 @@
-from .feature_processor import FeatureProcessor
-
-__all__ = ['FeatureProcessor']
\ No newline at end of file
+from .feature_processor import FeatureProcessor
+from .feature_spec import FeatureSpec, FeatureMatrix, default_spec
+
+__all__ = ['FeatureProcessor', 'FeatureSpec', 'FeatureMatrix', 'default_spec']
@@ -1,25 +1,86 @@
-import pandas as pd
-from sklearn.preprocessing import StandardScaler
-
-class FeatureProcessor:
-    # dataset column scaling
-    
-    def __init__(self):        
-        self.scaler = StandardScaler()
-    
-    def scale_features(self, X_train, X_test):
-        #scale dataset columns using sklearn
-        #params: X_train(DataFrame): training data
-        #params: X_test(DataFrame): test data
-        #returns: tuple: scaled training and test data
-        
-        X_train_scaled = pd.DataFrame(
-            self.scaler.fit_transform(X_train), 
-            columns=X_train.columns
-        )
-        X_test_scaled = pd.DataFrame(
-            self.scaler.transform(X_test), 
-            columns=X_test.columns
-        )
-        
-        return X_train_scaled, X_test_scaled
+import pandas as pd
+import numpy as np
+from sklearn.preprocessing import StandardScaler
+
+def scaler_affine(scaler):
+    # (offset, scale) of a fitted StandardScaler, scaler.transform(X) is (X - offset) / scale
+    # lets array paths scale rows without building a DataFrame or re-checking feature names per call
+    n_features = scaler.n_features_in_
+    offset = scaler.mean_ if scaler.with_mean and scaler.mean_ is not None else np.zeros(n_features)
+    scale = scaler.scale_ if scaler.with_std and scaler.scale_ is not None else np.ones(n_features)
+    return offset, scale
+
+def apply_affine(X, offset, scale):
+    # same arithmetic as StandardScaler.transform, on a C-contiguous float copy of X
+    X = np.array(X, dtype=X.dtype if X.dtype in (np.float32, np.float64) else np.float64, order='C')
+    X -= offset
+    X /= scale
+    return X
+
+
+class FeatureProcessor:
+    # dataset column scaling
+    
+    def __init__(self):        
+        self.scaler = StandardScaler()
+    
+    def scale_features(self, X_train, X_test):
+        #scale dataset columns using sklearn
+        #params: X_train(DataFrame): training data
+        #params: X_test(DataFrame): test data
+        #returns: tuple: scaled training and test data
+        
+        self.scaler.fit(X_train)
+        X_train_scaled = pd.DataFrame(self.transform_array(X_train.to_numpy()), columns=X_train.columns, copy=False)
+        X_test_scaled = pd.DataFrame(self.transform_array(X_test.to_numpy()), columns=X_test.columns, copy=False)
+        
+        return X_train_scaled, X_test_scaled
+    
+    def scale_arrays(self, X_train, X_test):
+        # scale_features for plain arrays, the column names stay with the caller
+        #params: X_train(ndarray): training rows
+        #params: X_test(ndarray): test rows
+        #returns: tuple: scaled C-contiguous training and test arrays
+        
+        self.scaler.fit(X_train)
+        return self.transform_array(X_train), self.transform_array(X_test)
+    
+    def transform_array(self, X):
+        # scaler.transform for an array, without the DataFrame round trip or feature-name checks
+        #params: X(ndarray): rows in the column order the scaler was fitted on
+        #returns: scaled C-contiguous array in X's float dtype
+        
+        return apply_affine(np.asarray(X), *scaler_affine(self.scaler))
+    
+    def scale_matrix(self, train, test):
+        # scale shared FeatureMatrix splits once for every target, columns are scaled independently
+        # so a target's columns come out exactly as if they had been scaled on their own
+        #params: train(FeatureMatrix): training rows, the scaler is fitted on all of its columns
+        #params: test(FeatureMatrix): test rows
+        #returns: tuple: scaled training and test FeatureMatrix
+        
+        # fitted on a frame so the scaler keeps the feature names for_columns selects by
+        self.scaler.fit(train.frame())
+        train_scaled = train.with_values(self.transform_array(train.values))
+        test_scaled = test.with_values(self.transform_array(test.values))
+        
+        return train_scaled, test_scaled
+    
+    def for_columns(self, columns):
+        # processor whose scaler covers only columns, for a model trained on part of a shared matrix
+        #params: columns(list): feature names the scaler was fitted on, in the model's order
+        #returns: FeatureProcessor with a fitted StandardScaler over columns
+        
+        positions = [list(self.scaler.feature_names_in_).index(name) for name in columns]
+        scaler = StandardScaler(**self.scaler.get_params())
+        for attr in ('mean_', 'var_', 'scale_'):
+            value = getattr(self.scaler, attr)
+            setattr(scaler, attr, value[positions] if value is not None else None)
+        samples = self.scaler.n_samples_seen_
+        scaler.n_samples_seen_ = samples[positions] if np.ndim(samples) else samples
+        scaler.n_features_in_ = len(columns)
+        scaler.feature_names_in_ = np.array(columns, dtype=object)
+        
+        processor = FeatureProcessor()
+        processor.scaler = scaler
+        return processor
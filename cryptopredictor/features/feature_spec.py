@@ -0,0 +1,223 @@
+import re
+import copy
+import json
+import hashlib
+import numpy as np
+import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
+
+PRICE_COLUMNS = ['Close', 'Open', 'High', 'Low']
+
+def _lag(x, periods):
+    out = np.full(len(x), np.nan)
+    if periods < len(x):
+        out[periods:] = x[:len(x) - periods]
+    return out
+
+def _rolling_mean(x, window):
+    out = np.full(len(x), np.nan)
+    if window <= len(x):
+        out[window - 1:] = sliding_window_view(x, window).mean(axis=1)
+    return out
+
+def _diff(x, periods):
+    out = np.full(len(x), np.nan)
+    if periods < len(x):
+        out[periods:] = x[periods:] - x[:len(x) - periods]
+    return out
+
+# kind -> kernel(column values, param), each returns a full-length column with NaN for the warm-up rows
+KERNELS = {
+    'lag': _lag,
+    'rolling_mean': _rolling_mean,
+    'diff': _diff,
+}
+
+# kind -> earlier rows a feature value depends on, for param
+LOOKBACK = {
+    'lag': lambda periods: periods,
+    'rolling_mean': lambda window: window - 1,
+    'diff': lambda periods: periods,
+}
+
+
+class FeatureSpec:
+    # declarative feature list, compiled once into one float matrix shared by every target
+    # model inputs are name templates over '{target}', so adding a feature is a single call here
+
+    def __init__(self, dtype=np.float64):
+        # params: dtype: float type of the compiled matrix, float32 halves its memory;
+        #         kernels always run in float64 and only the stored values are rounded
+        self.features = []      # (name, kind, column, param) in matrix column order
+        self.model_inputs = []  # feature names each target's model reads, '{target}' is filled in per target
+        self.dtype = np.dtype(dtype)
+
+    def add(self, name, kind, column, param):
+        if kind not in KERNELS:
+            raise ValueError(f"Unknown feature kind '{kind}', expected one of {tuple(KERNELS)}")
+        if any(existing == name for existing, _, _, _ in self.features):
+            raise ValueError(f"Feature '{name}' is already defined")
+        self.features.append((name, kind, column, param))
+        return self
+
+    def lag(self, column, periods=1, name=None):
+        return self.add(name or f'{column}_t-{periods}', 'lag', column, periods)
+
+    def rolling_mean(self, column, window, name=None):
+        return self.add(name or f'{column}_MA_{window}', 'rolling_mean', column, window)
+
+    def diff(self, column, periods=1, name=None):
+        return self.add(name or f'{column}_Change', 'diff', column, periods)
+
+    def inputs(self, *names):
+        # declare the model input columns, e.g. inputs('{target}_t-1', 'MA_5')
+        self.model_inputs.extend(names)
+        return self
+
+    @property
+    def columns(self):
+        return [name for name, _, _, _ in self.features]
+
+    @property
+    def sources(self):
+        # data columns the features read, in first-use order
+        return list(dict.fromkeys(column for _, _, column, _ in self.features))
+
+    @property
+    def history(self):
+        # earlier rows the deepest feature looks back over
+        return max((LOOKBACK[kind](param) for _, kind, _, param in self.features), default=0)
+
+    @property
+    def key(self):
+        # stable identifier of the features and model inputs, for caches
+        parts = [self.features, self.model_inputs]
+        if self.dtype != np.float64:
+            # float64 keys stay as they were before dtype existed
+            parts.append(self.dtype.name)
+        text = json.dumps(parts, default=str)
+        return hashlib.blake2b(text.encode(), digest_size=8).hexdigest()
+
+    def columns_for(self, target):
+        # model input columns for target, in the order the model sees them
+        return list(dict.fromkeys(name.format(target=target) for name in self.model_inputs))
+
+    def for_target(self, target):
+        # this spec, or a copy with the '{target}_t-<n>' lags added when target is not one it was built for
+        #returns: FeatureSpec whose columns cover columns_for(target)
+        spec = self
+        for template in self.model_inputs:
+            match = re.fullmatch(r'\{target\}_t-(\d+)', template)
+            name = template.format(target=target)
+            if match and name not in spec.columns:
+                spec = copy.deepcopy(self) if spec is self else spec
+                spec.lag(target, int(match.group(1)), name=name)
+        return spec
+
+    def compute(self, data):
+        # every feature over data's rows, warm-up rows included as NaN
+        #returns: (rows x features) Fortran-ordered array of the spec's dtype
+        values = np.empty((len(data), len(self.features)), dtype=self.dtype, order='F')
+        sources = {}
+        for i, (name, kind, column, param) in enumerate(self.features):
+            if column not in data.columns:
+                raise ValueError(f"Feature '{name}' needs column '{column}', which is not in the data")
+            if column not in sources:
+                sources[column] = np.asarray(data[column], dtype=np.float64)
+            values[:, i] = KERNELS[kind](sources[column], param)
+        return values
+
+    def compile(self, data):
+        # compute every feature and keep the rows where all of them are defined
+        #params: data(DataFrame): numeric source columns in time order
+        #returns: FeatureMatrix with one C-contiguous read-only array, labelled like data
+        values = self.compute(data)
+        valid = ~np.isnan(values).any(axis=1)
+        return FeatureMatrix(np.ascontiguousarray(values[valid]), self.columns, data.index[valid], self)
+
+    def tail(self, data):
+        # the last history rows of the source columns, all extend() needs to continue after data
+        return data[self.sources].iloc[max(len(data) - self.history, 0):].astype(np.float64)
+
+    def extend(self, tail, data):
+        # features for rows appended after the rows tail was taken from, O(rows x window) however long the history
+        # values are identical to compiling the full history, every feature only reads the last history rows
+        #params: tail(DataFrame): tail() of the rows before data
+        #params: data(DataFrame): the appended rows
+        #returns: (new feature rows, their labels, the tail to continue from next time)
+        combined = pd.concat([tail, data[self.sources]])
+        values = self.compute(combined)[len(tail):]
+        valid = ~np.isnan(values).any(axis=1)
+        return np.ascontiguousarray(values[valid]), data.index[valid], self.tail(combined)
+
+
+class FeatureMatrix:
+    # read-only (rows x features) float matrix with its column names, row labels and the spec that built it
+    # targets read their columns from the same array, take() and frame() only copy when selecting a subset
+
+    def __init__(self, values, columns, index, spec=None):
+        self.values = values
+        self.values.flags.writeable = False
+        self.columns = list(columns)
+        self.index = index
+        self.spec = spec
+        self._positions = {name: i for i, name in enumerate(self.columns)}
+
+    def __len__(self):
+        return len(self.values)
+
+    @property
+    def shape(self):
+        return self.values.shape
+
+    def positions(self, columns):
+        missing = [name for name in columns if name not in self._positions]
+        if missing:
+            raise ValueError(f"Features {missing} are not in the feature matrix")
+        return [self._positions[name] for name in columns]
+
+    def take(self, columns=None):
+        # the full shared array, or a copy holding only columns
+        if columns is None or list(columns) == self.columns:
+            return self.values
+        return self.values[:, self.positions(columns)]
+
+    def frame(self, columns=None):
+        # DataFrame over take(columns), labelled by row
+        return pd.DataFrame(self.take(columns), index=self.index,
+                            columns=self.columns if columns is None else list(columns), copy=False)
+
+    def rows(self, positions):
+        # a new matrix holding the rows at positions
+        return FeatureMatrix(np.ascontiguousarray(self.values[positions]), self.columns, self.index[positions], self.spec)
+
+    def with_values(self, values):
+        # same columns and rows over transformed values, e.g. after scaling
+        return FeatureMatrix(np.ascontiguousarray(values), self.columns, self.index, self.spec)
+
+
+def default_spec(columns, lags=3, ma_windows=(5, 10), target_columns=PRICE_COLUMNS, dtype=np.float64):
+    # the features the models have always used: lags of each price column, previous volume,
+    # moving averages and price change of Close
+    #params: columns(list): columns available in the data
+    #params: target_columns(list): columns that get lags, the other inputs are shared by every target
+    #params: dtype: float type of the compiled matrix, see FeatureSpec
+    #returns: FeatureSpec whose columns_for(target) are [target lags, Volume_t-1, MA_<w>..., Price_Change]
+    spec = FeatureSpec(dtype)
+    targets = [column for column in target_columns if column in columns]
+    for column in targets:
+        for i in range(1, lags + 1):
+            spec.lag(column, i)
+    spec.inputs(*[f'{{target}}_t-{i}' for i in range(1, lags + 1)])
+
+    if 'Volume' in columns:
+        spec.lag('Volume', 1)
+        spec.inputs('Volume_t-1')
+
+    source = 'Close' if 'Close' in columns else (targets[0] if targets else None)
+    if source is not None:
+        for window in ma_windows:
+            spec.rolling_mean(source, window, name=f'MA_{window}')
+        spec.diff(source, name='Price_Change')
+        spec.inputs(*[f'MA_{window}' for window in ma_windows], 'Price_Change')
+    return spec
@@ -1,3 +1,4 @@
-from .knn_regressor import KNNRegressor, SKLearnKNN
-
-__all__ = ['KNNRegressor', 'SKLearnKNN']
\ No newline at end of file
+from .knn_regressor import KNNRegressor, SKLearnKNN
+from .model_store import save_model, load_model
+
+__all__ = ['KNNRegressor', 'SKLearnKNN', 'save_model', 'load_model']
\ No newline at end of file
@@ -1,51 +1,234 @@
-import numpy as np
-import pandas as pd
-from sklearn.neighbors import KDTree
-from sklearn.base import BaseEstimator, RegressorMixin
-
-class KNNRegressor:
-    # KNN regressor using KDTree for fast neighbor search
-    
-    def __init__(self, k=3):
-        # params: k(int): number of neighbors
-        self.k = k
-        self.X_train = None
-        self.y_train = None
-        self.tree = None
-    
-    def fit(self, X_train, y_train):
-        # Store training data and build KDTree
-        self.X_train = X_train.values if isinstance(X_train, pd.DataFrame) else np.array(X_train)
-        self.y_train = y_train.values if hasattr(y_train, "values") else np.array(y_train)
-        
-        # Build KDTree for fast nearest neighbor search
-        self.tree = KDTree(self.X_train)
-        return self
-    
-    def predict(self, X_test):
-        # KDTree for KNN
-        X_test = X_test.values if isinstance(X_test, pd.DataFrame) else np.array(X_test)
-        distances, indices = self.tree.query(X_test, k=self.k)
-        
-        #multi-output prediction
-        if len(self.y_train.shape) > 1 and self.y_train.shape[1] > 1:
-            preds = np.array([self.y_train[idx].mean(axis=0) for idx in indices])
-        else:
-            preds = np.array([self.y_train[idx].mean() for idx in indices])
-        
-        return preds
-
-
-class SKLearnKNN(BaseEstimator, RegressorMixin):
-    # sklearn wrapper for the above KNNRegressor
-    
-    def __init__(self, k=3):
-        self.k = k
-    
-    def fit(self, X, y):
-        self.model = KNNRegressor(k=self.k)
-        self.model.fit(pd.DataFrame(X), y)
-        return self
-    
-    def predict(self, X):
-        return self.model.predict(pd.DataFrame(X))
+import threading
+import numpy as np
+import pandas as pd
+from sklearn.base import BaseEstimator, RegressorMixin
+
+from .neighbor_backends import BruteForceBackend, make_backend, select_backend
+
+WEIGHT_SCHEMES = ('uniform', 'distance', 'gaussian')
+
+def neighbor_weights(distances, weights='uniform', bandwidth=None):
+    # per-neighbor weights from query distances, None means a plain mean
+    #params: weights(str or callable): 'uniform', 'distance', 'gaussian' or func(distances) -> weights
+    #params: bandwidth(float): gaussian kernel width, defaults to each row's k-th neighbor distance
+    if callable(weights):
+        return weights(distances)
+    if weights == 'uniform':
+        return None
+    if weights == 'distance':
+        # inverse distance, exact matches take all the weight of their row
+        with np.errstate(divide='ignore'):
+            inv = 1.0 / distances
+        exact = np.isinf(inv)
+        exact_rows = exact.any(axis=1)
+        inv[exact_rows] = exact[exact_rows]
+        return inv
+    if weights == 'gaussian':
+        if bandwidth is None:
+            bandwidth = distances[:, -1:]
+        bandwidth = np.where(bandwidth > 0, bandwidth, 1.0)
+        return np.exp(-0.5 * (distances / bandwidth) ** 2)
+    raise ValueError(f"Unknown weights '{weights}', expected one of {WEIGHT_SCHEMES} or a callable")
+
+
+class KNNRegressor:
+    # KNN regressor on a pluggable neighbor index (KDTree by default)
+    
+    def __init__(self, k=3, weights='uniform', bandwidth=None, algorithm='kd_tree', leaf_size=40,
+                 rebuild_threshold=1024, p=2, allow_approximate=False):
+        # params: k(int): number of neighbors
+        # params: weights(str or callable): neighbor weighting, see neighbor_weights
+        # params: bandwidth(float): kernel width for 'gaussian' weights
+        # params: algorithm(str): 'kd_tree', 'ball_tree', 'brute', 'ivf' (approximate) or 'auto'
+        # params: leaf_size(int): leaf size for the tree backends, ignored by 'auto'
+        # params: rebuild_threshold(int): partial_fit rows buffered before the index is rebuilt in the background
+        # params: p(float): Minkowski power of the distance, 2 is euclidean and 1 manhattan
+        # params: allow_approximate(bool): let 'auto' pick the approximate 'ivf' index too (p=2 only)
+        self.k = k
+        self.weights = weights
+        self.bandwidth = bandwidth
+        self.algorithm = algorithm
+        self.leaf_size = leaf_size
+        self.rebuild_threshold = rebuild_threshold
+        self.p = p
+        self.allow_approximate = allow_approximate
+        self.X_train = None
+        self.y_train = None
+        self.tree = None
+        self.backend_ = None
+        self.calibration_ = None
+        
+        # rows [0, n_indexed) live in self.tree, the rest in the brute-force delta buffer
+        self.n_indexed = 0
+        self._delta = None
+        # partial_fit appends into buffers with spare capacity, X_train/y_train are then views of them
+        self._X_buffer = None
+        self._y_buffer = None
+        self._lock = threading.Lock()
+        self._rebuild_thread = None
+    
+    def fit(self, X_train, y_train):
+        # Store training data and build the neighbor index
+        self.wait_for_rebuild()
+        # arrays are used as given when already C-contiguous, DataFrames only at this edge
+        self.X_train = np.ascontiguousarray(X_train.values if isinstance(X_train, pd.DataFrame) else X_train)
+        self.y_train = np.asarray(y_train.values if hasattr(y_train, "values") else y_train)
+        
+        if self.algorithm == 'auto':
+            # quick calibration, the chosen backend and its timings are kept for inspection
+            self.tree, self.calibration_ = select_backend(self.X_train, self.k, allow_approximate=self.allow_approximate,
+                                                          p=self.p)
+        else:
+            self.tree = make_backend(self.algorithm, self.leaf_size, self.p).fit(self.X_train)
+        self.backend_ = self.tree.name
+        self.n_indexed = len(self.X_train)
+        self._delta = None
+        self._X_buffer = self._y_buffer = None
+        return self
+    
+    def partial_fit(self, X_new, y_new):
+        # append rows without touching the static index, they are searched by brute force until the next rebuild
+        X_new = X_new.values if isinstance(X_new, pd.DataFrame) else np.array(X_new)
+        y_new = y_new.values if hasattr(y_new, "values") else np.array(y_new)
+        if self.tree is None:
+            return self.fit(X_new, y_new)
+        
+        with self._lock:
+            # append only, indices handed out by earlier queries stay valid
+            self._append_rows(X_new, y_new)
+            self._delta = BruteForceBackend(p=self.p).fit(self.X_train[self.n_indexed:])
+            pending = len(self.X_train) - self.n_indexed
+        
+        if pending >= self.rebuild_threshold:
+            self.rebuild(background=True)
+        return self
+    
+    def _append_rows(self, X_new, y_new):
+        # amortised O(len(X_new)) append, the buffers double when full instead of copying all rows per call
+        n, m = len(self.X_train), len(X_new)
+        if self._X_buffer is None or n + m > len(self._X_buffer):
+            # rows [0, n) are never written again, so a rebuild still reading the old buffer is unaffected
+            capacity = max(2 * n, n + m)
+            X_buffer = np.empty((capacity,) + self.X_train.shape[1:], dtype=self.X_train.dtype)
+            y_buffer = np.empty((capacity,) + self.y_train.shape[1:], dtype=self.y_train.dtype)
+            X_buffer[:n] = self.X_train
+            y_buffer[:n] = self.y_train
+            self._X_buffer, self._y_buffer = X_buffer, y_buffer
+        self._X_buffer[n:n + m] = X_new
+        self._y_buffer[n:n + m] = y_new
+        self.X_train = self._X_buffer[:n + m]
+        self.y_train = self._y_buffer[:n + m]
+    
+    def rebuild(self, background=False):
+        # fold the delta buffer into a fresh index of the same kind, queries keep using the old one until the swap
+        if self._rebuild_thread is not None and self._rebuild_thread.is_alive():
+            return self
+        if background:
+            self._rebuild_thread = threading.Thread(target=self._rebuild_index, daemon=True)
+            self._rebuild_thread.start()
+        else:
+            self._rebuild_index()
+        return self
+    
+    def wait_for_rebuild(self):
+        # block until a background rebuild (if any) has been swapped in
+        if self._rebuild_thread is not None:
+            self._rebuild_thread.join()
+            self._rebuild_thread = None
+        return self
+    
+    def _rebuild_index(self):
+        with self._lock:
+            X_snapshot = self.X_train
+            leaf_size = getattr(self.tree, 'leaf_size', self.leaf_size)
+            backend = make_backend(self.tree.name, leaf_size, self.p)
+        
+        backend.fit(X_snapshot)
+        
+        with self._lock:
+            self.tree = backend
+            self.n_indexed = len(X_snapshot)
+            # rows appended while the index was building stay in the delta buffer
+            remaining = self.X_train[self.n_indexed:]
+            self._delta = BruteForceBackend(p=self.p).fit(remaining) if len(remaining) else None
+    
+    def kneighbors(self, X_test, k=None):
+        # raw neighbor query, returns (distances, indices) sorted nearest first
+        X_test = X_test.values if isinstance(X_test, pd.DataFrame) else X_test
+        # a float32 index is queried with float32 rows instead of converting float64 ones per call
+        X_test = np.asarray(X_test, dtype=np.float32 if self.X_train.dtype == np.float32 else None)
+        k = self.k if k is None else k
+        with self._lock:
+            tree, delta, n_indexed = self.tree, self._delta, self.n_indexed
+        if delta is None:
+            return tree.query(X_test, k)
+        
+        # merge the top-k of the static index with the top-k of the delta buffer
+        n_delta = len(delta.X)
+        if k > n_indexed + n_delta:
+            raise ValueError(f"k={k} is larger than the {n_indexed + n_delta} fitted points")
+        tree_dist, tree_idx = tree.query(X_test, min(k, n_indexed))
+        delta_dist, delta_idx = delta.query(X_test, min(k, n_delta))
+        distances = np.hstack([tree_dist, delta_dist])
+        indices = np.hstack([tree_idx, delta_idx + n_indexed])
+        order = np.argsort(distances, axis=1, kind='stable')[:, :k]
+        return np.take_along_axis(distances, order, axis=1), np.take_along_axis(indices, order, axis=1)
+    
+    def __getstate__(self):
+        # locks and threads do not pickle
+        self.wait_for_rebuild()
+        state = self.__dict__.copy()
+        state['_lock'] = None
+        state['_rebuild_thread'] = None
+        # only the used rows are pickled, the next partial_fit allocates fresh buffers
+        state['_X_buffer'] = state['_y_buffer'] = None
+        return state
+    
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+    
+    def predict(self, X_test):
+        # KDTree for KNN
+        distances, indices = self.kneighbors(X_test)
+        return self._aggregate(distances, indices)
+    
+    def _aggregate(self, distances, indices):
+        # average neighbor targets in one gather, (n, k) for 1-D targets or (n, k, m) for multi-output
+        y = self.y_train
+        if y.ndim > 1 and y.shape[1] == 1:
+            y = y[:, 0]
+        neighbor_targets = y[indices]
+        
+        w = neighbor_weights(distances, self.weights, self.bandwidth)
+        if w is None:
+            return neighbor_targets.mean(axis=1)
+        
+        #multi-output prediction
+        if neighbor_targets.ndim == 3:
+            w = w[:, :, None]
+        return (neighbor_targets * w).sum(axis=1) / w.sum(axis=1)
+
+
+class SKLearnKNN(BaseEstimator, RegressorMixin):
+    # sklearn wrapper for the above KNNRegressor
+    
+    def __init__(self, k=3, weights='uniform', bandwidth=None, algorithm='kd_tree', leaf_size=40, p=2,
+                 allow_approximate=False):
+        self.k = k
+        self.weights = weights
+        self.bandwidth = bandwidth
+        self.algorithm = algorithm
+        self.leaf_size = leaf_size
+        self.p = p
+        self.allow_approximate = allow_approximate
+    
+    def fit(self, X, y):
+        self.model = KNNRegressor(k=self.k, weights=self.weights, bandwidth=self.bandwidth,
+                                  algorithm=self.algorithm, leaf_size=self.leaf_size, p=self.p,
+                                  allow_approximate=self.allow_approximate)
+        self.model.fit(X, y)
+        return self
+    
+    def predict(self, X):
+        return self.model.predict(X)
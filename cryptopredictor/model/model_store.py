@@ -0,0 +1,129 @@
+import os
+import json
+import numpy as np
+from sklearn.preprocessing import StandardScaler
+
+from .knn_regressor import KNNRegressor
+from .neighbor_backends import BACKENDS, BruteForceBackend
+
+# On-disk layout of a saved model directory:
+#   meta.json            model params, backend params, scaler params, feature/target columns
+#   X_train.npy          indexed feature rows (shared by the index, never stored twice)
+#   y_train.npy          targets aligned with X_train
+#   index_<name>.npy     backend arrays (tree nodes, IVF cells, ...)
+#   scaler_<attr>.npy    StandardScaler mean_/var_/scale_
+# Large arrays are loaded with np.load(mmap_mode='r'), so processes loading the same directory
+# share one copy through the page cache. Tree indexes record the sklearn version and state layout
+# they were saved with and are rebuilt from X_train.npy when loaded under a different one.
+
+FORMAT_VERSION = 1
+SCALER_ARRAYS = ('mean_', 'var_', 'scale_')
+
+def save_model(path, model, scaler=None, feature_columns=None, target_column=None):
+    # write a fitted KNNRegressor (plus optional scaler and column metadata) to directory path
+    #params: path(str): target directory, created if needed
+    #params: model(KNNRegressor): fitted model
+    #params: scaler(StandardScaler): fitted scaler used for the model's features
+    #params: feature_columns(list): names of the feature columns in order
+    #params: target_column(str): name of the predicted column
+    if model.tree is None:
+        raise ValueError("Model must be fitted before it can be saved")
+    if callable(model.weights):
+        raise ValueError("Models with callable weights cannot be saved, use a named weighting scheme")
+
+    os.makedirs(path, exist_ok=True)
+    model.wait_for_rebuild()
+
+    X_train = np.ascontiguousarray(model.X_train)
+    np.save(os.path.join(path, 'X_train.npy'), X_train)
+    np.save(os.path.join(path, 'y_train.npy'), np.ascontiguousarray(model.y_train))
+
+    index_arrays, index_meta = model.tree.get_state(X_train[:model.n_indexed])
+    for name, array in index_arrays.items():
+        np.save(os.path.join(path, f'index_{name}.npy'), array)
+
+    meta = {
+        'format_version': FORMAT_VERSION,
+        'model': {
+            'k': model.k,
+            'weights': model.weights,
+            'bandwidth': model.bandwidth,
+            'algorithm': model.algorithm,
+            'leaf_size': model.leaf_size,
+            'rebuild_threshold': model.rebuild_threshold,
+            'p': model.p,
+            'allow_approximate': model.allow_approximate,
+        },
+        'index': {
+            'backend': model.tree.name,
+            'n_indexed': int(model.n_indexed),
+            'arrays': sorted(index_arrays),
+            'params': index_meta,
+        },
+        'feature_columns': list(feature_columns) if feature_columns is not None else None,
+        'target_column': target_column,
+        'scaler': None,
+    }
+
+    if scaler is not None:
+        for attr in SCALER_ARRAYS:
+            value = getattr(scaler, attr)
+            if value is not None:
+                np.save(os.path.join(path, f'scaler_{attr}.npy'), value)
+        meta['scaler'] = {
+            'params': scaler.get_params(),
+            'n_features_in_': int(scaler.n_features_in_),
+            'n_samples_seen_': np.asarray(scaler.n_samples_seen_).tolist(),
+            'feature_names_in_': list(getattr(scaler, 'feature_names_in_', [])) or None,
+            'arrays': [attr for attr in SCALER_ARRAYS if getattr(scaler, attr) is not None],
+        }
+
+    with open(os.path.join(path, 'meta.json'), 'w') as f:
+        json.dump(meta, f, indent=2)
+    return path
+
+def load_model(path, mmap_mode='r'):
+    # load a directory written by save_model, the index is only rebuilt if its saved state no longer fits
+    #params: mmap_mode(str): passed to np.load, None reads everything into memory
+    #returns: dict with 'model', 'scaler', 'k', 'feature_columns' and 'target_column'
+    with open(os.path.join(path, 'meta.json')) as f:
+        meta = json.load(f)
+    if meta.get('format_version') != FORMAT_VERSION:
+        raise ValueError(f"Unsupported model format version: {meta.get('format_version')}")
+
+    def load(name):
+        return np.load(os.path.join(path, f'{name}.npy'), mmap_mode=mmap_mode)
+
+    model = KNNRegressor(**meta['model'])
+    model.X_train = load('X_train')
+    model.y_train = load('y_train')
+
+    index = meta['index']
+    arrays = {name: load(f'index_{name}') for name in index['arrays']}
+    n_indexed = index['n_indexed']
+    model.tree = BACKENDS[index['backend']]().set_state(model.X_train[:n_indexed], arrays, index['params'])
+    model.backend_ = model.tree.name
+    model.n_indexed = n_indexed
+
+    # rows that were still in the partial_fit buffer when saved go back into it
+    if n_indexed < len(model.X_train):
+        model._delta = BruteForceBackend(p=model.p).fit(model.X_train[n_indexed:])
+
+    scaler = None
+    if meta['scaler'] is not None:
+        scaler_meta = meta['scaler']
+        scaler = StandardScaler(**scaler_meta['params'])
+        for attr in SCALER_ARRAYS:
+            setattr(scaler, attr, np.load(os.path.join(path, f'scaler_{attr}.npy')) if attr in scaler_meta['arrays'] else None)
+        scaler.n_features_in_ = scaler_meta['n_features_in_']
+        scaler.n_samples_seen_ = np.asarray(scaler_meta['n_samples_seen_']) if isinstance(scaler_meta['n_samples_seen_'], list) else scaler_meta['n_samples_seen_']
+        if scaler_meta['feature_names_in_']:
+            scaler.feature_names_in_ = np.array(scaler_meta['feature_names_in_'], dtype=object)
+
+    return {
+        'model': model,
+        'scaler': scaler,
+        'k': model.k,
+        'feature_columns': meta['feature_columns'],
+        'target_column': meta['target_column'],
+    }
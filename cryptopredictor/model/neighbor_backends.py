@@ -0,0 +1,287 @@
+import time
+import numpy as np
+import sklearn
+from scipy.spatial.distance import cdist
+from sklearn.neighbors import KDTree, BallTree
+
+try:
+    # float32 trees index float32 rows without a float64 copy, private in sklearn >= 1.5
+    from sklearn.neighbors._kd_tree import KDTree32
+    from sklearn.neighbors._ball_tree import BallTree32
+except ImportError:
+    KDTree32 = BallTree32 = None
+
+# Every backend exposes get_state(X) -> (arrays, meta) and set_state(X, arrays, meta) so a fitted
+# index can be written as .npy files and restored around memory-mapped arrays without a rebuild.
+# X (the indexed rows) is stored once by the caller and is never part of the returned arrays.
+
+class KDTreeBackend:
+    # exact search with sklearn KDTree, best for low dimensional features
+    name = 'kd_tree'
+    tree_class = KDTree
+    tree_class32 = KDTree32
+
+    def __init__(self, leaf_size=40, p=2):
+        # params: p(float): Minkowski power, 2 is euclidean and 1 manhattan
+        self.leaf_size = leaf_size
+        self.p = p
+        self.index = None
+
+    def _tree_class(self, dtype):
+        # float32 rows get the float32 tree when sklearn has one, anything else is indexed as float64
+        if dtype == np.float32 and self.tree_class32 is not None:
+            return self.tree_class32
+        return self.tree_class
+
+    def fit(self, X):
+        self.index = self._tree_class(X.dtype)(X, leaf_size=self.leaf_size, metric='minkowski', p=self.p)
+        return self
+
+    def query(self, X, k):
+        return self.index.query(X, k=k)
+
+    def get_state(self, X):
+        # sklearn tree state is (data, idx_array, node_data, node_bounds, scalars..., metric, ...)
+        state = self.index.__getstate__()
+        shares_data = state[0].dtype == X.dtype and state[0].shape == X.shape
+        arrays = {f'tree_{i}': v for i, v in enumerate(state)
+                  if isinstance(v, np.ndarray) and not (i == 0 and shares_data)}
+        scalars = {str(i): v for i, v in enumerate(state) if isinstance(v, (int, float))}
+        # the state is private and stored by position, so record which sklearn layout it came from
+        return arrays, {'leaf_size': self.leaf_size, 'p': self.p, 'scalars': scalars,
+                        'sklearn_version': sklearn.__version__, 'state_length': len(state)}
+
+    def set_state(self, X, arrays, meta):
+        # take the non-array parts (metric object etc.) from a throwaway tree of this sklearn version
+        self.leaf_size = meta['leaf_size']
+        self.p = meta.get('p', 2)
+        tree_class = self._tree_class(X.dtype)
+        state = list(tree_class(np.zeros((1, X.shape[1]), dtype=X.dtype), leaf_size=self.leaf_size,
+                                metric='minkowski', p=self.p).__getstate__())
+        if meta.get('sklearn_version') != sklearn.__version__ or meta.get('state_length') != len(state):
+            # saved by another sklearn (or before this was recorded), positions may not line up, index X again
+            return self.fit(X)
+        state[0] = X
+        for i in range(len(state)):
+            if f'tree_{i}' in arrays:
+                state[i] = arrays[f'tree_{i}']
+            elif str(i) in meta['scalars']:
+                state[i] = meta['scalars'][str(i)]
+        self.index = tree_class.__new__(tree_class)
+        self.index.__setstate__(tuple(state))
+        return self
+
+
+class BallTreeBackend(KDTreeBackend):
+    # exact search with sklearn BallTree, holds up better than KDTree on wider feature sets
+    name = 'ball_tree'
+    tree_class = BallTree
+    tree_class32 = BallTree32
+
+
+class BruteForceBackend:
+    # exact search as a chunked matrix product, lets BLAS do the work
+    name = 'brute'
+
+    def __init__(self, chunk_size=None, max_chunk_elements=2 ** 23, p=2):
+        # params: chunk_size(int): query rows per block, derived from max_chunk_elements if None
+        # params: p(float): Minkowski power, anything but 2 uses scipy cdist instead of the matrix product
+        self.chunk_size = chunk_size
+        self.max_chunk_elements = max_chunk_elements
+        self.p = p
+        self.X = None
+        self.sq_norms = None
+
+    def fit(self, X):
+        self.X = np.ascontiguousarray(X)
+        self.sq_norms = np.einsum('ij,ij->i', self.X, self.X)
+        return self
+
+    def query(self, X, k):
+        X = np.asarray(X, dtype=self.X.dtype)
+        n_train = len(self.X)
+        if k > n_train:
+            raise ValueError(f"k={k} is larger than the {n_train} indexed points")
+
+        chunk = self.chunk_size or max(1, self.max_chunk_elements // n_train)
+        distances = np.empty((len(X), k), dtype=np.float64)
+        indices = np.empty((len(X), k), dtype=np.intp)
+
+        for start in range(0, len(X), chunk):
+            block = X[start:start + chunk]
+            if self.p == 2:
+                # |q - x|^2 = |q|^2 - 2 q.x + |x|^2
+                d2 = self.sq_norms[None, :] - 2.0 * (block @ self.X.T)
+                d2 += np.einsum('ij,ij->i', block, block)[:, None]
+                np.maximum(d2, 0, out=d2)
+            else:
+                # ranked as squares so the shared code below applies
+                d2 = cdist(block, self.X, 'minkowski', p=self.p) ** 2
+
+            top = np.argpartition(d2, k - 1, axis=1)[:, :k]
+            top_d2 = np.take_along_axis(d2, top, axis=1)
+            order = np.argsort(top_d2, axis=1)
+            indices[start:start + chunk] = np.take_along_axis(top, order, axis=1)
+            distances[start:start + chunk] = np.sqrt(np.take_along_axis(top_d2, order, axis=1))
+
+        return distances, indices
+
+    def get_state(self, X):
+        return {'sq_norms': self.sq_norms}, {'chunk_size': self.chunk_size, 'max_chunk_elements': self.max_chunk_elements, 'p': self.p}
+
+    def set_state(self, X, arrays, meta):
+        self.chunk_size = meta['chunk_size']
+        self.max_chunk_elements = meta['max_chunk_elements']
+        self.p = meta.get('p', 2)
+        self.X = X
+        self.sq_norms = arrays['sq_norms']
+        return self
+
+
+class IVFBackend:
+    # approximate search with an inverted file index: k-means cells, only the n_probe nearest cells are scanned
+    name = 'ivf'
+
+    def __init__(self, n_lists=None, n_probe=8, n_iter=10, random_state=0):
+        # params: n_lists(int): number of k-means cells, defaults to sqrt(n)
+        # params: n_probe(int): cells scanned per query, higher is slower but more exact
+        self.n_lists = n_lists
+        self.n_probe = n_probe
+        self.n_iter = n_iter
+        self.random_state = random_state
+        self.X = None
+        self.centroids = None
+        self.lists = None
+
+    def fit(self, X):
+        self.X = np.ascontiguousarray(X)
+        n_lists = min(len(self.X), self.n_lists or max(1, int(np.sqrt(len(self.X)))))
+        rng = np.random.default_rng(self.random_state)
+        self.centroids = self.X[rng.choice(len(self.X), n_lists, replace=False)].copy()
+
+        # a few Lloyd iterations are enough for a coarse quantizer
+        for _ in range(self.n_iter):
+            assign = BruteForceBackend().fit(self.centroids).query(self.X, 1)[1][:, 0]
+            counts = np.bincount(assign, minlength=n_lists)
+            sums = np.zeros_like(self.centroids)
+            np.add.at(sums, assign, self.X)
+            filled = counts > 0
+            self.centroids[filled] = sums[filled] / counts[filled, None]
+
+        assign = BruteForceBackend().fit(self.centroids).query(self.X, 1)[1][:, 0]
+        order = np.argsort(assign, kind='stable')
+        bounds = np.searchsorted(assign[order], np.arange(n_lists + 1))
+        self.lists = [order[bounds[c]:bounds[c + 1]] for c in range(n_lists)]
+        return self
+
+    def query(self, X, k):
+        X = np.asarray(X, dtype=self.X.dtype)
+        if k > len(self.X):
+            raise ValueError(f"k={k} is larger than the {len(self.X)} indexed points")
+
+        n_probe = min(self.n_probe, len(self.centroids))
+        probes = BruteForceBackend().fit(self.centroids).query(X, n_probe)[1]
+        best_d2 = np.full((len(X), k), np.inf)
+        best_idx = np.full((len(X), k), -1, dtype=np.intp)
+
+        # scan cell by cell, merging each cell's candidates into the running top-k of the queries that probe it
+        for c, members in enumerate(self.lists):
+            rows = np.flatnonzero((probes == c).any(axis=1))
+            if len(rows) == 0 or len(members) == 0:
+                continue
+            block = X[rows]
+            cand = self.X[members]
+            d2 = np.einsum('ij,ij->i', block, block)[:, None] - 2.0 * (block @ cand.T) + np.einsum('ij,ij->i', cand, cand)[None, :]
+            np.maximum(d2, 0, out=d2)
+
+            merged_d2 = np.hstack([best_d2[rows], d2])
+            merged_idx = np.hstack([best_idx[rows], np.broadcast_to(members, d2.shape)])
+            top = np.argpartition(merged_d2, k - 1, axis=1)[:, :k]
+            best_d2[rows] = np.take_along_axis(merged_d2, top, axis=1)
+            best_idx[rows] = np.take_along_axis(merged_idx, top, axis=1)
+
+        # rows whose probed cells held fewer than k points fall back to an exact scan
+        short = np.flatnonzero(np.isinf(best_d2).any(axis=1))
+        if len(short):
+            exact_d, exact_idx = BruteForceBackend().fit(self.X).query(X[short], k)
+            best_d2[short] = exact_d ** 2
+            best_idx[short] = exact_idx
+
+        order = np.argsort(best_d2, axis=1)
+        return np.sqrt(np.take_along_axis(best_d2, order, axis=1)), np.take_along_axis(best_idx, order, axis=1)
+
+    def get_state(self, X):
+        # cells are stored as one concatenated member array plus offsets
+        sizes = np.array([len(members) for members in self.lists])
+        arrays = {
+            'centroids': self.centroids,
+            'list_members': np.concatenate(self.lists),
+            'list_bounds': np.concatenate([[0], np.cumsum(sizes)]),
+        }
+        meta = {'n_lists': self.n_lists, 'n_probe': self.n_probe, 'n_iter': self.n_iter, 'random_state': self.random_state}
+        return arrays, meta
+
+    def set_state(self, X, arrays, meta):
+        self.__init__(**meta)
+        self.X = X
+        self.centroids = arrays['centroids']
+        bounds = arrays['list_bounds']
+        members = arrays['list_members']
+        self.lists = [members[bounds[c]:bounds[c + 1]] for c in range(len(bounds) - 1)]
+        return self
+
+
+BACKENDS = {
+    'kd_tree': KDTreeBackend,
+    'ball_tree': BallTreeBackend,
+    'brute': BruteForceBackend,
+    'ivf': IVFBackend,
+}
+
+def make_backend(algorithm='kd_tree', leaf_size=40, p=2):
+    # build an unfitted backend by name
+    if algorithm not in BACKENDS:
+        raise ValueError(f"Unknown algorithm '{algorithm}', expected 'auto' or one of {list(BACKENDS)}")
+    if algorithm in ('kd_tree', 'ball_tree'):
+        return BACKENDS[algorithm](leaf_size=leaf_size, p=p)
+    if algorithm == 'brute':
+        return BruteForceBackend(p=p)
+    if p != 2:
+        raise ValueError(f"Algorithm '{algorithm}' only supports p=2")
+    return BACKENDS[algorithm]()
+
+def select_backend(X, k, leaf_sizes=(16, 40, 100), sample_size=256, allow_approximate=False, random_state=0, p=2,
+                   fit_size=5000):
+    # time every candidate on a row sample, then fit only the winner on all of X, return (fitted backend, timings)
+    #params: sample_size(int): query rows timed per candidate
+    #params: fit_size(int): rows every candidate is built on for the timing, the full build happens once
+    #params: allow_approximate(bool): also consider the IVF index (p=2 only)
+    #returns: fastest backend and {label: {'build': s, 'query': s}} timings, measured on the sample
+    rng = np.random.default_rng(random_state)
+    X_fit = X[np.sort(rng.choice(len(X), fit_size, replace=False))] if len(X) > fit_size else X
+    sample = X_fit[rng.choice(len(X_fit), min(sample_size, len(X_fit)), replace=False)]
+    k = min(k, len(X_fit))
+
+    candidates = [KDTreeBackend(leaf_size, p) for leaf_size in leaf_sizes]
+    candidates += [BallTreeBackend(leaf_size, p) for leaf_size in leaf_sizes]
+    candidates.append(BruteForceBackend(p=p))
+    if allow_approximate and p == 2:
+        candidates.append(IVFBackend())
+
+    timings = {}
+    best, best_time = None, np.inf
+    for backend in candidates:
+        label = f"{backend.name}(leaf_size={backend.leaf_size})" if hasattr(backend, 'leaf_size') else backend.name
+        start = time.perf_counter()
+        backend.fit(X_fit)
+        built = time.perf_counter()
+        backend.query(sample, k)
+        # rank by query cost, the index is queried far more often than it is built
+        query_time = time.perf_counter() - built
+        timings[label] = {'build': built - start, 'query': query_time}
+        if query_time < best_time:
+            best, best_time = backend, query_time
+
+    if X_fit is not X:
+        best = make_backend(best.name, getattr(best, 'leaf_size', 40), p).fit(X)
+    return best, timings
@@ -1,3 +1,6 @@
-from .threading_processor import ThreadingProcessor
-
-__all__ = ["ThreadingProcessor",]
\ No newline at end of file
+from .threading_processor import ThreadingProcessor
+from .worker_pool import WorkerPool
+from .benchmark import benchmark_backends
+from .job import Job, start_job
+
+__all__ = ["ThreadingProcessor", "WorkerPool", "benchmark_backends", "Job", "start_job",]
\ No newline at end of file
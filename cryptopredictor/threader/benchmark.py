@@ -0,0 +1,25 @@
+import io
+import time
+import contextlib
+
+from .threading_processor import ThreadingProcessor
+
+def benchmark_backends(func, param_list, shared_arrays=None, backends=('serial', 'thread', 'process'),
+                       max_workers=None, repeats=3):
+    # time process_parallel on every backend with the same tasks
+    #params: repeats(int): runs per backend, the best one is kept
+    #returns: {backend: seconds} plus the backend 'auto' would pick under the 'auto' key
+    timings = {}
+    for backend in backends:
+        threader = ThreadingProcessor(max_workers=max_workers, backend=backend)
+        best = float('inf')
+        for _ in range(repeats):
+            start = time.perf_counter()
+            with contextlib.redirect_stdout(io.StringIO()):
+                threader.process_parallel(func, param_list, shared_arrays)
+            best = min(best, time.perf_counter() - start)
+        timings[backend] = best
+
+    tasks = [(None, func, params, shared_arrays) for params in param_list]
+    timings['auto'] = ThreadingProcessor(max_workers=max_workers).choose_backend(tasks)
+    return timings
@@ -0,0 +1,138 @@
+import time
+import threading
+import concurrent.futures
+
+class Job:
+    # handle for a background run: completed/total progress with an ETA, cancel(), and a future for the result
+    # the producer side (add_total, advance, track) is called from the thread doing the work
+
+    def __init__(self, description=''):
+        self.description = description
+        self.total = 0
+        self.completed = 0
+        self.started = time.monotonic()
+        self.future = concurrent.futures.Future()
+        self._cancel_event = threading.Event()
+        self._lock = threading.Lock()
+        self._pending = set()   # pool futures not finished yet
+        self._listeners = []
+        self.thread = None
+
+    def add_listener(self, callback):
+        # callback(progress dict) runs on every update, from the working thread
+        self._listeners.append(callback)
+        return self
+
+    def progress(self):
+        # snapshot of {'description', 'completed', 'total', 'fraction', 'elapsed', 'eta'}, eta is None until a task is done
+        with self._lock:
+            completed, total, description = self.completed, self.total, self.description
+        elapsed = time.monotonic() - self.started
+        eta = elapsed / completed * (total - completed) if completed and total >= completed else None
+        return {
+            'description': description,
+            'completed': completed,
+            'total': total,
+            'fraction': completed / total if total else 0.0,
+            'elapsed': elapsed,
+            'eta': eta,
+        }
+
+    def cancel(self):
+        # stop the run: pool tasks that have not started are dropped, running ones finish and are discarded
+        # returns False if the job had already finished
+        if self.future.done() and not self.future.cancelled():
+            return False
+        self._cancel_event.set()
+        with self._lock:
+            pending, self._pending = self._pending, set()
+        for future in pending:
+            future.cancel()
+        self.future.cancel()
+        return True
+
+    def cancelled(self):
+        return self._cancel_event.is_set()
+
+    def raise_if_cancelled(self):
+        # checkpoint for code running under the job
+        if self._cancel_event.is_set():
+            raise concurrent.futures.CancelledError(f"Job '{self.description}' was cancelled")
+
+    def done(self):
+        return self.future.done()
+
+    def result(self, timeout=None):
+        # raises CancelledError if the job was cancelled, or the exception the run raised
+        return self.future.result(timeout)
+
+    def set_stage(self, description):
+        # name the current stage, shown alongside the progress
+        with self._lock:
+            self.description = description
+        self._notify()
+
+    def add_total(self, n, description=None):
+        # announce n more tasks, optionally naming the current stage
+        with self._lock:
+            self.total += n
+            if description is not None:
+                self.description = description
+        self._notify()
+
+    def advance(self, n=1, description=None):
+        # mark n tasks completed
+        with self._lock:
+            self.completed += n
+            if description is not None:
+                self.description = description
+        self._notify()
+
+    def track(self, futures):
+        # register pool futures so cancel() can drop the ones still queued
+        # finished futures are forgotten again, the job does not keep their results alive
+        with self._lock:
+            self._pending.update(futures)
+        for future in futures:
+            future.add_done_callback(self._untrack)
+        if self._cancel_event.is_set():
+            for future in futures:
+                future.cancel()
+
+    def _untrack(self, future):
+        with self._lock:
+            self._pending.discard(future)
+
+    def _notify(self):
+        progress = self.progress()
+        for callback in self._listeners:
+            callback(progress)
+
+    def _finish(self, result=None, error=None):
+        # the future may already be cancelled, later results are dropped
+        try:
+            if error is not None:
+                self.future.set_exception(error)
+            else:
+                self.future.set_result(result)
+        except concurrent.futures.InvalidStateError:
+            pass
+
+
+def start_job(func, *args, description='', **kwargs):
+    # run func(*args, job=job, **kwargs) on a daemon thread and return the Job handle at once
+    job = Job(description)
+
+    def run():
+        try:
+            result = func(*args, job=job, **kwargs)
+        except concurrent.futures.CancelledError:
+            job.future.cancel()
+        except Exception as e:
+            job._finish(error=e)
+        else:
+            job._finish(result)
+
+    job.thread = threading.Thread(target=run, daemon=True)
+    job.thread.start()
+    return job
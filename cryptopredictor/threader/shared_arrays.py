@@ -0,0 +1,87 @@
+import sys
+import threading
+import numpy as np
+from multiprocessing import shared_memory, resource_tracker
+
+# arrays attached in this (worker) process, keyed by shared memory block name
+_attached = {}
+_attach_lock = threading.Lock()
+
+class SharedArrays:
+    # copy numpy arrays into shared memory once, tasks only carry the small handles
+
+    def __init__(self, arrays):
+        # params: arrays(dict): name -> array, converted to contiguous numpy arrays
+        self.blocks = []
+        self.handles = {}
+        for name, array in arrays.items():
+            array = np.ascontiguousarray(array.values if hasattr(array, "values") else array)
+            if array.dtype == object:
+                raise TypeError(f"Array '{name}' has object dtype and cannot be shared")
+            block = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+            np.ndarray(array.shape, dtype=array.dtype, buffer=block.buf)[...] = array
+            # unmapped here right away, so workers forked later do not inherit a mapping that outlives eviction
+            block.close()
+            self.blocks.append(block)
+            self.handles[name] = (block.name, array.shape, array.dtype.str)
+
+    def close(self):
+        # unlink every block, workers must be done with them
+        for block in self.blocks:
+            block.unlink()
+        self.blocks = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def attach_arrays(handles):
+    # zero-copy read-only views of shared arrays, attached once per process
+    arrays = {}
+    for name, (block_name, shape, dtype) in handles.items():
+        with _attach_lock:
+            if block_name not in _attached:
+                block = _attach_untracked(block_name)
+                view = np.ndarray(shape, dtype=np.dtype(dtype), buffer=block.buf)
+                view.flags.writeable = False
+                _attached[block_name] = (block, view)
+        arrays[name] = _attached[block_name][1]
+    return arrays
+
+
+def _attach_untracked(block_name):
+    # the creating process owns the block, attaching must not register it with the resource tracker
+    # or the tracker would unlink it (or complain) when a worker exits
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name=block_name, track=False)
+    register = resource_tracker.register
+    resource_tracker.register = lambda *args, **kwargs: None
+    try:
+        return shared_memory.SharedMemory(name=block_name)
+    finally:
+        resource_tracker.register = register
+
+
+def release_stale(live):
+    # close this process's attachments to blocks that are not in live, the parent has released or will release them
+    # a worker runs one task at a time, so nothing of the current task is attached yet
+    with _attach_lock:
+        for block_name in [block_name for block_name in _attached if block_name not in live]:
+            block, view = _attached.pop(block_name)
+            del view
+            try:
+                block.close()
+            except BufferError:
+                # a view is still referenced elsewhere, the mapping goes away with its last reference
+                pass
+
+
+def run_with_shared(func, handles, params, live=None):
+    # worker-side entry point: attach the shared arrays and pass them as keyword arguments
+    # params: live(set): names of every block the parent still keeps, other attachments are closed first
+    if live is not None:
+        release_stale(live)
+    return func(**attach_arrays(handles), **params)
@@ -1,27 +1,145 @@
-import concurrent.futures
-from typing import List, Callable, Any, Dict, Tuple
-
-class ThreadingProcessor:
-    def __init__(self, max_workers=None):
-        self.max_workers = max_workers
-
-    def process_parallel(self, func: Callable, param_list: List[Dict[str, Any]]) -> List[Tuple[Any, Any]]:
-        results = []
-        with concurrent.futures.ProcessPoolExecutor(max_workers=self.max_workers) as executor:
-            futures = {executor.submit(func, **params): next(iter(params.values())) for params in param_list}
-            
-            for future in concurrent.futures.as_completed(futures):
-                key = futures[future]
-                try:
-                    result = future.result()
-                    results.append((key, result))
-                    print(f"Completed for {key}")
-                except Exception as e:
-                    print(f"Exception for {key}: {e}")
-                    results.append((key, None))
-        return sorted(results, key=lambda x: x[0])
-
-    @staticmethod
-    def create_param_list(param_name: str, param_values: List[Any], fixed_params: Dict[str, Any] = None) -> List[Dict[str, Any]]:
-        fixed_params = fixed_params or {}
-        return [{param_name: v, **fixed_params} for v in param_values]
+import os
+import concurrent.futures
+from typing import List, Callable, Any, Dict, Tuple
+
+from .shared_arrays import SharedArrays, run_with_shared
+
+BACKENDS = ('serial', 'thread', 'process', 'auto')
+
+class ThreadingProcessor:
+    # auto backend thresholds, in training rows x tasks
+    # UNMEASURED placeholders: benchmark_backends has only been run on a single core, where serial wins at
+    # every size (choose_backend returns 'serial' there). Set these from benchmark_backends on a multi-core machine.
+    SERIAL_WORK = 200_000       # below this, pool startup is assumed to cost more than the work itself
+    PROCESS_WORK = 20_000_000   # above this, process startup and the shared memory copy are assumed to pay off
+
+    def __init__(self, max_workers=None, pool=None, backend='process'):
+        # params: pool(WorkerPool): long-lived pool to submit to, a temporary one is started per call if None
+        # params: backend(str): 'serial', 'thread' (sklearn tree queries release the GIL), 'process' or 'auto'
+        if backend not in BACKENDS:
+            raise ValueError(f"Unknown backend '{backend}', expected one of {BACKENDS}")
+        self.max_workers = max_workers
+        self.pool = pool
+        self.backend = backend
+        self.last_backend = None
+
+    def process_parallel(self, func: Callable, param_list: List[Dict[str, Any]],
+                         shared_arrays: Dict[str, Any] = None, job=None) -> List[Tuple[Any, Any]]:
+        # shared_arrays (name -> array) are placed in shared memory once and passed to func as keyword arguments
+        tasks = [(next(iter(params.values())), func, params, shared_arrays) for params in param_list]
+        return self.process_tasks(tasks, job)
+
+    def process_tasks(self, tasks: List[Tuple[Any, Callable, Dict[str, Any], Dict[str, Any]]], job=None) -> List[Tuple[Any, Any]]:
+        # run heterogeneous (key, func, params, shared_arrays) tasks in submission order, keys must be sortable
+        # tasks that pass the same shared_arrays dict object share one copy of it
+        # params: job(Job): receives per-task progress, raises CancelledError here once cancelled
+        if job is not None:
+            job.add_total(len(tasks))
+        backend = self.choose_backend(tasks) if self.backend == 'auto' else self.backend
+        self.last_backend = backend
+
+        if backend == 'serial':
+            return self._run_serial(tasks, job)
+
+        if backend == 'thread':
+            # threads see the arrays directly, nothing is copied
+            with concurrent.futures.ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                return self._run(executor, tasks, None, job)
+
+        if self.pool is not None:
+            return self._run(self.pool.executor, tasks, self.pool.share, job, self.pool.release, self.pool.live_blocks)
+
+        shared = []
+        def share(arrays):
+            shared.append(SharedArrays(arrays))
+            return shared[-1].handles
+
+        try:
+            with concurrent.futures.ProcessPoolExecutor(max_workers=self.max_workers) as executor:
+                return self._run(executor, tasks, share, job,
+                                 live=lambda: {name for block in shared for name, _, _ in block.handles.values()})
+        finally:
+            for block in shared:
+                block.close()
+
+    def choose_backend(self, tasks):
+        # pick serial/thread/process from the worker count, task count and dataset size
+        # more workers than cores only adds overhead
+        cores = os.cpu_count() or 1
+        requested = self.max_workers or (self.pool.max_workers if self.pool is not None else None) or cores
+        workers = min(requested, cores)
+        if workers <= 1 or len(tasks) <= 1:
+            return 'serial'
+
+        rows = max((len(next(iter(arrays.values()))) for _, _, _, arrays in tasks if arrays), default=0)
+        work = rows * len(tasks)
+        if work < self.SERIAL_WORK:
+            return 'serial'
+        # a persistent pool that is already running has paid for process startup
+        if work > self.PROCESS_WORK or (self.pool is not None and self.pool.started):
+            return 'process'
+        return 'thread'
+
+    @staticmethod
+    def _run_serial(tasks, job=None):
+        results = []
+        for key, func, params, arrays in tasks:
+            if job is not None:
+                job.raise_if_cancelled()
+            try:
+                results.append((key, func(**(arrays or {}), **params)))
+                print(f"Completed for {key}")
+            except Exception as e:
+                print(f"Exception for {key}: {e}")
+                results.append((key, None))
+            if job is not None:
+                job.advance()
+        return sorted(results, key=lambda x: x[0])
+
+    @staticmethod
+    def _run(executor, tasks, share, job=None, release=None, live=None):
+        # share=None passes the arrays straight to func, for executors running in this process
+        # release(handles) unpins each shared dataset once all tasks are done, live() names the blocks workers
+        # may keep attached, every dataset of this call is shared (and pinned) before live() is taken
+        results = []
+        handles = {}
+        futures = {}
+        if share is not None:
+            for _, _, _, arrays in tasks:
+                if arrays and id(arrays) not in handles:
+                    handles[id(arrays)] = share(arrays)
+        live_blocks = frozenset(live()) if live is not None and handles else None
+        try:
+            for key, func, params, arrays in tasks:
+                if arrays and share is not None:
+                    futures[executor.submit(run_with_shared, func, handles[id(arrays)], params, live_blocks)] = key
+                else:
+                    futures[executor.submit(func, **(arrays or {}), **params)] = key
+            if job is not None:
+                job.track(list(futures))
+
+            for future in concurrent.futures.as_completed(futures):
+                key = futures[future]
+                if future.cancelled():
+                    continue
+                try:
+                    result = future.result()
+                    results.append((key, result))
+                    print(f"Completed for {key}")
+                except Exception as e:
+                    print(f"Exception for {key}: {e}")
+                    results.append((key, None))
+                if job is not None:
+                    job.advance()
+        finally:
+            if release is not None:
+                for shared_handles in handles.values():
+                    release(shared_handles)
+        if job is not None:
+            job.raise_if_cancelled()
+        return sorted(results, key=lambda x: x[0])
+
+    @staticmethod
+    def create_param_list(param_name: str, param_values: List[Any], fixed_params: Dict[str, Any] = None) -> List[Dict[str, Any]]:
+        fixed_params = fixed_params or {}
+        return [{param_name: v, **fixed_params} for v in param_values]
@@ -0,0 +1,105 @@
+import hashlib
+import threading
+import concurrent.futures
+from collections import OrderedDict
+import numpy as np
+
+from .shared_arrays import SharedArrays
+
+def _warm_worker():
+    # pay the numpy/sklearn import once per worker process instead of once per task
+    import sklearn.neighbors  # noqa: F401
+    import sklearn.model_selection  # noqa: F401
+
+def array_fingerprint(array):
+    # content hash of an array, equal data gives an equal key whatever object holds it
+    array = np.ascontiguousarray(array.values if hasattr(array, "values") else array)
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(f"{array.dtype.str}{array.shape}".encode())
+    digest.update(array.data if array.flags.c_contiguous else array.tobytes())
+    return digest.hexdigest()
+
+
+class WorkerPool:
+    # long-lived process pool owned by the application, reused across targets and retrains
+    # datasets are kept in shared memory keyed by content hash so a repeat run does not copy them again
+    # a dataset is only evicted once no queued or running task uses it, workers drop their mappings of
+    # evicted datasets before their next task
+
+    def __init__(self, max_workers=None, max_datasets=8):
+        # params: max_workers(int): worker processes, defaults to the CPU count
+        # params: max_datasets(int): shared datasets kept alive, least recently used ones are released first
+        self.max_workers = max_workers
+        self.max_datasets = max_datasets
+        self._executor = None
+        self._datasets = OrderedDict()
+        self._in_use = {}    # dataset key -> process_tasks calls holding it until their tasks are done
+        self._lock = threading.Lock()
+
+    @property
+    def executor(self):
+        # started on first use, workers import sklearn once in the initializer
+        if self._executor is None:
+            self._executor = concurrent.futures.ProcessPoolExecutor(
+                max_workers=self.max_workers, initializer=_warm_worker
+            )
+        return self._executor
+
+    @property
+    def started(self):
+        # True once worker processes have been spawned
+        return self._executor is not None
+
+    def share(self, arrays):
+        # place arrays in shared memory (or reuse an identical dataset already there), return the handles
+        # the dataset stays pinned until release(handles)
+        key = tuple((name, array_fingerprint(array)) for name, array in sorted(arrays.items()))
+        with self._lock:
+            if key in self._datasets:
+                self._datasets.move_to_end(key)
+            else:
+                self._datasets[key] = SharedArrays(arrays)
+            self._in_use[key] = self._in_use.get(key, 0) + 1
+            self._evict()
+            return self._datasets[key].handles
+
+    def release(self, handles):
+        # unpin a dataset returned by share() once every task using it is done
+        with self._lock:
+            for key, shared in self._datasets.items():
+                if shared.handles is handles:
+                    self._in_use[key] -= 1
+                    if not self._in_use[key]:
+                        del self._in_use[key]
+                    break
+            self._evict()
+
+    def live_blocks(self):
+        # names of every shared memory block the pool still keeps, for workers to drop the rest
+        with self._lock:
+            return {block_name for shared in self._datasets.values() for block_name, _, _ in shared.handles.values()}
+
+    def _evict(self):
+        # least recently used first, never a dataset that queued or running tasks still use
+        for key in list(self._datasets):
+            if len(self._datasets) <= self.max_datasets:
+                break
+            if key not in self._in_use:
+                self._datasets.pop(key).close()
+
+    def shutdown(self, wait=True):
+        # stop the workers and release every shared dataset
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait)
+            self._executor = None
+        with self._lock:
+            while self._datasets:
+                _, shared = self._datasets.popitem()
+                shared.close()
+            self._in_use = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.shutdown()
@@ -1 +1 @@
-# This file makes the gui directory a Python package
+# This file makes the gui directory a Python package
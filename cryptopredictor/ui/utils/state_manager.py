@@ -1,96 +1,131 @@
-import os
-import threading
-import pandas as pd
-import tkinter as tk
-
-class StateManager:
-    """Manages shared state and data between GUI components."""
-    
-    def __init__(self):
-        """Initialize the state manager with default values."""
-        # Input parameters
-        self.data_file_path = tk.StringVar()
-        self.output_dir = tk.StringVar(value="output")
-        self.use_threading = tk.BooleanVar(value=True)
-        self.forecast_days = tk.IntVar(value=7)
-        self.k_min = tk.IntVar(value=1)
-        self.k_max = tk.IntVar(value=20)
-        
-        # Forecast attribute selection variables
-        self.forecast_attributes = {
-            'Close': tk.BooleanVar(value=True),
-            'Open': tk.BooleanVar(value=False),
-            'High': tk.BooleanVar(value=False),
-            'Low': tk.BooleanVar(value=False)
-        }
-        
-        # Selected target columns for forecast
-        self.selected_target_columns = ['Close']
-        
-        # Data containers
-        self.data = None
-        self.processed_data = None
-        self.data_loader = None
-        
-        # Model containers
-        self.model = None
-        self.feature_processor = None
-        self.optimal_k = None
-        self.eval_results = None
-        self.model_evaluator = None
-        self.k_range = None
-        self.trained_models = {}  # Dictionary to store multiple models for different targets
-        
-        # Test data
-        self.X_train = None
-        self.X_test = None 
-        self.y_train = None
-        self.y_test = None
-        
-        # Forecast data
-        self.future_forecast = None   # For backward compatibility
-        self.future_forecasts = {}    # Dictionary for multiple forecasts
-        self.forecast_df = None
-        
-        # Threading control
-        self.threads = []
-    
-    def reset(self):
-        """Reset all state variables to their default values."""
-        self.data = None
-        self.processed_data = None
-        self.data_loader = None
-        self.model = None
-        self.feature_processor = None
-        self.optimal_k = None
-        self.eval_results = None
-        self.model_evaluator = None
-        self.k_range = None
-        self.X_train = None
-        self.X_test = None
-        self.y_train = None
-        self.y_test = None
-        self.future_forecast = None
-        self.forecast_df = None
-        
-        # Stop any running threads
-        for thread in self.threads:
-            if thread.is_alive():
-                # Cannot actually stop threads in Python,
-                # but we can clear the list
-                pass
-        self.threads = []
-    
-    def start_thread(self, target, args=()):
-        """Start a new daemon thread and keep track of it."""
-        thread = threading.Thread(target=target, args=args, daemon=True)
-        self.threads.append(thread)
-        thread.start()
-        return thread
-    
-    def ensure_output_dir(self):
-        """Ensure the output directory exists."""
-        output_dir = self.output_dir.get()
-        if output_dir and not os.path.exists(output_dir):
-            os.makedirs(output_dir)
-        return output_dir
+import os
+import threading
+import pandas as pd
+import tkinter as tk
+from cryptopredictor.threader.worker_pool import WorkerPool
+from cryptopredictor.threader.job import start_job
+from cryptopredictor.evaluator.score_cache import ScoreCache
+
+class StateManager:
+    """Manages shared state and data between GUI components."""
+    
+    def __init__(self):
+        """Initialize the state manager with default values."""
+        # Input parameters
+        self.data_file_path = tk.StringVar()
+        self.output_dir = tk.StringVar(value="output")
+        self.use_threading = tk.BooleanVar(value=True)
+        self.forecast_days = tk.IntVar(value=7)
+        self.k_min = tk.IntVar(value=1)
+        self.k_max = tk.IntVar(value=20)
+        
+        # Forecast attribute selection variables
+        self.forecast_attributes = {
+            'Close': tk.BooleanVar(value=True),
+            'Open': tk.BooleanVar(value=False),
+            'High': tk.BooleanVar(value=False),
+            'Low': tk.BooleanVar(value=False)
+        }
+        
+        # Selected target columns for forecast
+        self.selected_target_columns = ['Close']
+        
+        # Data containers
+        self.data = None
+        self.processed_data = None
+        self.data_loader = None
+        
+        # Model containers
+        self.model = None
+        self.feature_processor = None
+        self.optimal_k = None
+        self.eval_results = None
+        self.model_evaluator = None
+        self.k_range = None
+        self.trained_models = {}  # Dictionary to store multiple models for different targets
+        
+        # Test data
+        self.X_train = None
+        self.X_test = None 
+        self.y_train = None
+        self.y_test = None
+        
+        # Forecast data
+        self.future_forecast = None   # For backward compatibility
+        self.future_forecasts = {}    # Dictionary for multiple forecasts
+        self.forecast_df = None
+        
+        # Threading control
+        self.threads = []
+        self.jobs = []
+        self.worker_pool = None
+        self.score_cache = None
+    
+    def reset(self):
+        """Reset all state variables to their default values."""
+        self.data = None
+        self.processed_data = None
+        self.data_loader = None
+        self.model = None
+        self.feature_processor = None
+        self.optimal_k = None
+        self.eval_results = None
+        self.model_evaluator = None
+        self.k_range = None
+        self.X_train = None
+        self.X_test = None
+        self.y_train = None
+        self.y_test = None
+        self.future_forecast = None
+        self.forecast_df = None
+        
+        # Stop any running jobs, their queued pool tasks are dropped
+        self.cancel_jobs()
+        self.threads = []
+    
+    def start_thread(self, target, args=()):
+        """Start a new daemon thread and keep track of it."""
+        thread = threading.Thread(target=target, args=args, daemon=True)
+        self.threads.append(thread)
+        thread.start()
+        return thread
+    
+    def start_job(self, func, *args, description=''):
+        """Run func(*args, job=job) in the background and return its cancellable Job handle."""
+        self.jobs = [job for job in self.jobs if not job.done()]
+        job = start_job(func, *args, description=description)
+        self.jobs.append(job)
+        return job
+    
+    def cancel_jobs(self):
+        """Cancel every job that is still running."""
+        for job in self.jobs:
+            job.cancel()
+        self.jobs = []
+    
+    def get_worker_pool(self):
+        """Return the application-wide process pool, starting it on first use."""
+        if self.worker_pool is None:
+            self.worker_pool = WorkerPool()
+        return self.worker_pool
+    
+    def get_score_cache(self):
+        """Return the on-disk cache of k-search scores kept in the output directory."""
+        path = os.path.join(self.ensure_output_dir() or '.', 'evaluation_cache.sqlite')
+        if self.score_cache is None or self.score_cache.path != path:
+            self.score_cache = ScoreCache(path)
+        return self.score_cache
+    
+    def shutdown(self):
+        """Cancel running jobs and release the worker pool and its shared datasets."""
+        self.cancel_jobs()
+        if self.worker_pool is not None:
+            self.worker_pool.shutdown(wait=False)
+            self.worker_pool = None
+    
+    def ensure_output_dir(self):
+        """Ensure the output directory exists."""
+        output_dir = self.output_dir.get()
+        if output_dir and not os.path.exists(output_dir):
+            os.makedirs(output_dir)
+        return output_dir
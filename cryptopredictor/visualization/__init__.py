@@ -1,3 +1,3 @@
-from .visualizer import Visualizer
-
+from .visualizer import Visualizer
+
 __all__ = ['Visualizer']
\ No newline at end of file
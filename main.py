@@ -1,205 +1,297 @@
-import os
-import pandas as pd
-import numpy as np
-import multiprocessing
-import argparse
-
-# Import modules from cryptopredictor package
-from cryptopredictor.data.data_loader import DataLoader
-from cryptopredictor.features.feature_processor import FeatureProcessor
-from cryptopredictor.model.knn_regressor import KNNRegressor
-from cryptopredictor.evaluator.model_evaluator import ModelEvaluator
-from cryptopredictor.forecaster.price_forecaster import PriceForecaster
-from cryptopredictor.visualization.visualizer import Visualizer
-
-def main(use_gui=True):
-    if use_gui:
-        # Import here to avoid circular imports
-        from cryptopredictor.ui.app import launch_gui
-        launch_gui()
-        return
-        
-    # Create output directory if it doesn't exist
-    output_dir = 'Output files'
-    if not os.path.exists(output_dir):
-        os.makedirs(output_dir)
-    
-    print("=== Cryptocurrency Price Prediction with KNN ===")
-    
-    # Load and preprocess data
-    print("\nLoading and preprocessing data...")
-    data_file = "Crypto_currency.csv"
-    
-    # Check if the file exists
-    if not os.path.exists(data_file):
-        print(f"Error: File {data_file} not found.")
-        return
-    
-    data_loader = DataLoader(data_file)
-    data = data_loader.load_data()
-    data_loader.print_data_info()
-    
-    # Preprocess the data
-    processed_data = data_loader.preprocess_data()
-    
-    # Set up model training options
-    print("\nSetting up model training options...")
-    
-    # Ask user which price columns to predict
-    available_price_columns = ['Close', 'Open', 'High', 'Low']
-    
-    print("\nHow would you like to predict cryptocurrency prices?")
-    print("1. Predict all price values (Close, Open, High, Low)")
-    print("2. Predict specific price values")
-    
-    prediction_choice = input("Enter your choice (1 or 2): ")
-    
-    if prediction_choice == '1':
-        selected_targets = available_price_columns
-        print(f"Selected all targets for prediction: {', '.join(selected_targets)}")
-    else:
-        print("\nAvailable price targets to predict:")
-        for i, col in enumerate(available_price_columns):
-            print(f"{i+1}. {col}")
-        
-        target_input = input("\nEnter the numbers of targets to predict (e.g., '1,3' for Close and High): ")
-        selected_indices = [int(idx.strip())-1 for idx in target_input.split(',') if idx.strip().isdigit()]
-        
-        if not selected_indices:
-            print("No valid targets selected. Defaulting to 'Close'")
-            selected_targets = ['Close']
-        else:
-            selected_targets = [available_price_columns[i] for i in selected_indices if i < len(available_price_columns)]
-            print(f"Selected targets for prediction: {', '.join(selected_targets)}")
-    
-    # Ask user if they want to use threading
-    use_threading = input("Use parallel processing for model evaluation? (y/n): ").lower() == 'y'
-    
-    # Dictionary to store trained models and related info
-    trained_models = {}
-    
-    # Train a model for each selected target
-    for target in selected_targets:
-        print(f"\n--- Training model for {target} prediction ---")
-        
-        # Get data for this target
-        X_train, X_test, y_train, y_test, feature_columns = data_loader.split_data(target_column=target)
-        print(f"Training set: {X_train.shape}")
-        print(f"Test set: {X_test.shape}")
-        
-        # Scale features
-        print(f"\nScaling features for {target} model...")
-        feature_processor = FeatureProcessor()
-        X_train_scaled, X_test_scaled = feature_processor.scale_features(X_train, X_test)
-        
-        # Find optimal k and train model
-        print(f"\nFinding optimal k and training the {target} model...")
-        k_range = list(range(1, 21))  # Test k from 1 to 20
-        
-        model_evaluator = ModelEvaluator(X_train_scaled, y_train)
-        
-        if use_threading:
-            # Determine number of workers based on CPU cores, but be conservative
-            num_workers = max(4, max(1, multiprocessing.cpu_count() // 2))
-            print(f"Using {num_workers} workers for parallel processing")
-            model_evaluator.enable_threading(max_workers=num_workers)
-        else:
-            print("Using sequential processing")
-            
-        try:
-            optimal_k = model_evaluator.find_optimal_k(k_range)
-            
-            # Train the final model with the optimal k
-            print(f"\nTraining final {target} model with optimal k={optimal_k}...")
-            model = KNNRegressor(k=optimal_k)
-            model.fit(X_train_scaled, y_train)
-            
-            # Evaluate model performance
-            print(f"\nEvaluating {target} model performance...")
-            eval_results = model_evaluator.evaluate_model(model, X_test_scaled, y_test)
-            
-            # Store model and related info
-            trained_models[target] = {
-                'model': model,
-                'scaler': feature_processor.scaler,
-                'k': optimal_k,
-                'feature_columns': feature_columns,
-                'rmse_values': model_evaluator.rmse_values,
-                'predictions': eval_results['predictions'],
-                'y_test': y_test
-            }
-            
-            # Visualize results
-            print(f"\nVisualizing {target} results...")
-            visualizer = Visualizer(output_dir)
-            visualizer.plot_rmse_vs_k(k_range, model_evaluator.rmse_values, target_column=target)
-            visualizer.plot_actual_vs_predicted(y_test, eval_results['predictions'], optimal_k, target_column=target)
-            
-        except Exception as e:
-            print(f"Error during model evaluation for {target}: {str(e)}")
-            print("Falling back to default k=5")
-            model = KNNRegressor(k=5)
-            model.fit(X_train_scaled, y_train)
-            
-            # Store model and related info with default k
-            trained_models[target] = {
-                'model': model,
-                'scaler': feature_processor.scaler,
-                'k': 5,
-                'feature_columns': feature_columns,
-                'rmse_values': model_evaluator.rmse_values if hasattr(model_evaluator, 'rmse_values') else None,
-                'predictions': None,
-                'y_test': y_test
-            }
-    
-    # Forecast future prices
-    print("\nForecasting future prices...")
-    forecast_days = int(input("Enter number of days to forecast: "))
-    
-    # Get the last data points for forecasting
-    last_date = pd.to_datetime(data['Date'].values[-1])
-    print(f"\nLast date in the dataset: {last_date.strftime('%Y-%m-%d')}")
-    last_days_data = data_loader.get_last_days_data()
-    
-    # Initialize and use the forecaster
-    forecaster = PriceForecaster()
-    forecasts = {}
-    
-    # Generate forecasts for each target
-    for target, model_info in trained_models.items():
-        print(f"\nGenerating {target} forecast...")
-        forecasts[target] = forecaster.forecast(
-            model_info['model'], 
-            model_info['scaler'], 
-            last_days_data, 
-            forecast_days,
-            target_column=target,
-            feature_columns=model_info['feature_columns']
-        )
-    
-    # Create forecast DataFrame and save to CSV
-    forecast_df = forecaster.create_forecast_dataframe(forecasts, last_date, selected_targets)
-    forecast_output_path = os.path.join(output_dir, 'price_forecast.csv')
-    forecaster.save_forecast(forecast_df, forecast_output_path)
-    
-    # Display first and last dates in the forecast
-    print(f"\nForecast date range: {forecast_df['Date'].min().strftime('%Y-%m-%d')} to {forecast_df['Date'].max().strftime('%Y-%m-%d')}")
-    
-    # Visualize forecasts
-    print("\nVisualizing forecasts...")
-    # Convert string dates to datetime objects if needed
-    if not pd.api.types.is_datetime64_any_dtype(data['Date']):
-        data['Date'] = pd.to_datetime(data['Date'])
-    
-    forecast_dates = forecast_df['Date'].values
-    visualizer.plot_forecast(data, forecasts, forecast_dates, selected_targets)
-    
-    print("\n=== Analysis Complete ===")
-    print(f"Results and visualizations saved in {output_dir} folder.")
-
-if __name__ == "__main__":
-    parser = argparse.ArgumentParser(description='Cryptocurrency Price Prediction with KNN')
-    parser.add_argument('--console', action='store_true', help='Run in console mode instead of GUI')
-    args = parser.parse_args()
-    
-    main(use_gui=not args.console)
\ No newline at end of file
+import os
+import pandas as pd
+import numpy as np
+import multiprocessing
+import argparse
+
+# Import modules from cryptopredictor package
+from cryptopredictor.data.data_loader import DataLoader
+from cryptopredictor.features.feature_processor import FeatureProcessor
+from cryptopredictor.model.knn_regressor import KNNRegressor
+from cryptopredictor.evaluator.model_evaluator import ModelEvaluator
+from cryptopredictor.evaluator.training_scheduler import TrainingScheduler
+from cryptopredictor.evaluator.score_cache import ScoreCache
+from cryptopredictor.evaluator.batch_trainer import BatchTrainer
+from cryptopredictor.forecaster.price_forecaster import PriceForecaster
+from cryptopredictor.visualization.visualizer import Visualizer
+from cryptopredictor.threader.threading_processor import ThreadingProcessor
+from cryptopredictor.threader.worker_pool import WorkerPool
+
+# columns the models read, Adj Close is never parsed
+MODEL_COLUMNS = ['Open', 'High', 'Low', 'Close', 'Volume']
+
+def main(use_gui=True, start=None, end=None, dtype=np.float64):
+    if use_gui:
+        # Import here to avoid circular imports
+        from cryptopredictor.ui.app import launch_gui
+        launch_gui()
+        return
+        
+    # Create output directory if it doesn't exist
+    output_dir = 'Output files'
+    if not os.path.exists(output_dir):
+        os.makedirs(output_dir)
+    
+    print("=== Cryptocurrency Price Prediction with KNN ===")
+    
+    # Load and preprocess data
+    print("\nLoading and preprocessing data...")
+    data_file = "Crypto_currency.csv"
+    
+    # Check if the file exists
+    if not os.path.exists(data_file):
+        print(f"Error: File {data_file} not found.")
+        return
+    
+    data_loader = DataLoader(data_file, cache_dir=os.path.join(output_dir, 'data_cache'),
+                             columns=MODEL_COLUMNS, start=start, end=end, dtype=dtype)
+    data = data_loader.load_data()
+    data_loader.print_data_info()
+    
+    # Preprocess the data
+    processed_data = data_loader.preprocess_data()
+    
+    # Set up model training options
+    print("\nSetting up model training options...")
+    
+    # Ask user which price columns to predict
+    available_price_columns = ['Close', 'Open', 'High', 'Low']
+    
+    print("\nHow would you like to predict cryptocurrency prices?")
+    print("1. Predict all price values (Close, Open, High, Low)")
+    print("2. Predict specific price values")
+    
+    prediction_choice = input("Enter your choice (1 or 2): ")
+    
+    if prediction_choice == '1':
+        selected_targets = available_price_columns
+        print(f"Selected all targets for prediction: {', '.join(selected_targets)}")
+    else:
+        print("\nAvailable price targets to predict:")
+        for i, col in enumerate(available_price_columns):
+            print(f"{i+1}. {col}")
+        
+        target_input = input("\nEnter the numbers of targets to predict (e.g., '1,3' for Close and High): ")
+        selected_indices = [int(idx.strip())-1 for idx in target_input.split(',') if idx.strip().isdigit()]
+        
+        if not selected_indices:
+            print("No valid targets selected. Defaulting to 'Close'")
+            selected_targets = ['Close']
+        else:
+            selected_targets = [available_price_columns[i] for i in selected_indices if i < len(available_price_columns)]
+            print(f"Selected targets for prediction: {', '.join(selected_targets)}")
+    
+    # Ask user if they want to use threading
+    use_threading = input("Use parallel processing for model evaluation? (y/n): ").lower() == 'y'
+    
+    # One pool for all targets so workers start and import sklearn only once
+    worker_pool = None
+    if use_threading:
+        # Determine number of workers based on CPU cores, but be conservative
+        num_workers = max(4, max(1, multiprocessing.cpu_count() // 2))
+        print(f"Using {num_workers} workers for parallel processing")
+        worker_pool = WorkerPool(max_workers=num_workers)
+    
+    # Dictionary to store trained models and related info
+    trained_models = {}
+    k_range = list(range(1, 21))  # Test k from 1 to 20
+    
+    # Scores of earlier runs on the same data are reused, only new k values are evaluated
+    score_cache = ScoreCache(os.path.join(output_dir, 'evaluation_cache.sqlite'))
+    
+    # Every target reads its columns from one feature matrix, split and scaled once
+    print("\nScaling features for all targets...")
+    train_features, test_features = data_loader.split_features()
+    shared_processor = FeatureProcessor()
+    train_scaled, test_scaled = shared_processor.scale_matrix(train_features, test_features)
+    
+    # Prepare scaled data and an evaluator for each selected target
+    prepared = {}
+    for target in selected_targets:
+        print(f"\n--- Preparing data for {target} prediction ---")
+        
+        # Get data for this target
+        feature_columns = data_loader.features.spec.columns_for(target)
+        X_train_scaled = train_scaled.frame(feature_columns)
+        X_test_scaled = test_scaled.frame(feature_columns)
+        y_train = data_loader.numeric_data[target].loc[train_scaled.index]
+        y_test = data_loader.numeric_data[target].loc[test_scaled.index]
+        print(f"Training set: {X_train_scaled.shape}")
+        print(f"Test set: {X_test_scaled.shape}")
+        
+        # the target's slice of the shared scaler, used again when forecasting
+        feature_processor = shared_processor.for_columns(feature_columns)
+        
+        prepared[target] = {
+            'X_train_scaled': X_train_scaled,
+            'X_test_scaled': X_test_scaled,
+            'y_train': y_train,
+            'y_test': y_test,
+            'feature_columns': feature_columns,
+            'feature_processor': feature_processor,
+            'model_evaluator': ModelEvaluator(X_train_scaled, y_train).enable_sweep().enable_cache(
+                score_cache, target=target, feature_config=feature_columns)
+        }
+    
+    # With parallel processing every target x CV fold is scheduled on the pool at once
+    scheduled = False
+    if use_threading:
+        print("\nFinding optimal k for all targets in parallel...")
+        scheduler = TrainingScheduler(ThreadingProcessor(max_workers=num_workers, pool=worker_pool, backend='auto'))
+        for target in selected_targets:
+            scheduler.add_target(target, prepared[target]['model_evaluator'])
+        try:
+            scheduler.run(k_range)
+            scheduled = True
+        except Exception as e:
+            print(f"Parallel k search failed: {e}, falling back to sequential.")
+    else:
+        print("Using sequential processing")
+    
+    # Train a model for each selected target
+    for target in selected_targets:
+        print(f"\n--- Training model for {target} prediction ---")
+        X_train_scaled = prepared[target]['X_train_scaled']
+        X_test_scaled = prepared[target]['X_test_scaled']
+        y_train = prepared[target]['y_train']
+        y_test = prepared[target]['y_test']
+        feature_columns = prepared[target]['feature_columns']
+        feature_processor = prepared[target]['feature_processor']
+        model_evaluator = prepared[target]['model_evaluator']
+        
+        try:
+            if scheduled:
+                optimal_k = model_evaluator.optimal_k
+            else:
+                print(f"\nFinding optimal k and training the {target} model...")
+                optimal_k = model_evaluator.find_optimal_k(k_range)
+            
+            # Train the final model with the optimal k
+            print(f"\nTraining final {target} model with optimal k={optimal_k}...")
+            model = KNNRegressor(k=optimal_k, weights=model_evaluator.optimal_weights)
+            model.fit(X_train_scaled, y_train)
+            
+            # Evaluate model performance
+            print(f"\nEvaluating {target} model performance...")
+            eval_results = model_evaluator.evaluate_model(model, X_test_scaled, y_test)
+            
+            # Store model and related info
+            trained_models[target] = {
+                'model': model,
+                'scaler': feature_processor.scaler,
+                'k': optimal_k,
+                'feature_columns': feature_columns,
+                'rmse_values': model_evaluator.rmse_values,
+                'predictions': eval_results['predictions'],
+                'y_test': y_test
+            }
+            
+            # Visualize results
+            print(f"\nVisualizing {target} results...")
+            visualizer = Visualizer(output_dir)
+            visualizer.plot_rmse_vs_k(model_evaluator.k_values, model_evaluator.rmse_values, target_column=target)
+            visualizer.plot_actual_vs_predicted(y_test, eval_results['predictions'], optimal_k, target_column=target)
+            
+        except Exception as e:
+            print(f"Error during model evaluation for {target}: {str(e)}")
+            print("Falling back to default k=5")
+            model = KNNRegressor(k=5)
+            model.fit(X_train_scaled, y_train)
+            
+            # Store model and related info with default k
+            trained_models[target] = {
+                'model': model,
+                'scaler': feature_processor.scaler,
+                'k': 5,
+                'feature_columns': feature_columns,
+                'rmse_values': model_evaluator.rmse_values if hasattr(model_evaluator, 'rmse_values') else None,
+                'predictions': None,
+                'y_test': y_test
+            }
+    
+    if worker_pool is not None:
+        worker_pool.shutdown()
+    
+    # Forecast future prices
+    print("\nForecasting future prices...")
+    forecast_days = int(input("Enter number of days to forecast: "))
+    
+    # Get the last data points for forecasting
+    last_date = pd.to_datetime(data['Date'].values[-1])
+    print(f"\nLast date in the dataset: {last_date.strftime('%Y-%m-%d')}")
+    last_days_data = data_loader.get_last_days_data()
+    
+    # Initialize and use the forecaster
+    forecaster = PriceForecaster()
+    forecasts = {}
+    
+    # Generate forecasts for each target
+    for target, model_info in trained_models.items():
+        print(f"\nGenerating {target} forecast...")
+        forecasts[target] = forecaster.forecast(
+            model_info['model'], 
+            model_info['scaler'], 
+            last_days_data, 
+            forecast_days,
+            target_column=target,
+            feature_columns=model_info['feature_columns']
+        )
+    
+    # Create forecast DataFrame and save to CSV
+    forecast_df = forecaster.create_forecast_dataframe(forecasts, last_date, selected_targets)
+    forecast_output_path = os.path.join(output_dir, 'price_forecast.csv')
+    forecaster.save_forecast(forecast_df, forecast_output_path)
+    
+    # Display first and last dates in the forecast
+    print(f"\nForecast date range: {forecast_df['Date'].min().strftime('%Y-%m-%d')} to {forecast_df['Date'].max().strftime('%Y-%m-%d')}")
+    
+    # Visualize forecasts
+    print("\nVisualizing forecasts...")
+    # Convert string dates to datetime objects if needed
+    if not pd.api.types.is_datetime64_any_dtype(data['Date']):
+        data['Date'] = pd.to_datetime(data['Date'])
+    
+    forecast_dates = forecast_df['Date'].values
+    visualizer.plot_forecast(data, forecasts, forecast_dates, selected_targets)
+    
+    print("\n=== Analysis Complete ===")
+    print(f"Results and visualizations saved in {output_dir} folder.")
+
+def run_batch(data_path, forecast_days=5, workers=None, start=None, end=None, dtype=np.float64):
+    # train and forecast every symbol of a directory or long-format CSV, one process pool task per symbol
+    output_dir = 'Output files'
+    if not os.path.exists(output_dir):
+        os.makedirs(output_dir)
+    
+    print("=== Multi-asset Price Prediction with KNN ===")
+    data_loader = DataLoader(data_path, cache_dir=os.path.join(output_dir, 'data_cache'),
+                             columns=MODEL_COLUMNS, start=start, end=end, dtype=dtype)
+    symbols = data_loader.symbols()
+    print(f"\nFound {len(symbols)} symbols in {data_path}")
+    
+    score_cache = ScoreCache(os.path.join(output_dir, 'evaluation_cache.sqlite'))
+    with WorkerPool(max_workers=workers) as worker_pool:
+        trainer = BatchTrainer(ThreadingProcessor(pool=worker_pool), forecast_days=forecast_days, score_cache=score_cache)
+        forecast_df = trainer.run(data_loader, symbols)
+    
+    forecast_output_path = os.path.join(output_dir, 'batch_forecast.csv')
+    PriceForecaster().save_forecast(forecast_df, forecast_output_path)
+    trainer.scores.to_csv(os.path.join(output_dir, 'batch_scores.csv'), index=False)
+    print(f"\nThroughput: {trainer.throughput:.1f} symbols per minute")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Cryptocurrency Price Prediction with KNN')
+    parser.add_argument('--console', action='store_true', help='Run in console mode instead of GUI')
+    parser.add_argument('--batch', metavar='PATH', help='Train every symbol of a directory of CSV files or a CSV with a Symbol column')
+    parser.add_argument('--days', type=int, default=5, help='Days to forecast in batch mode')
+    parser.add_argument('--workers', type=int, default=None, help='Worker processes in batch mode')
+    parser.add_argument('--start', default=None, help='Only use rows dated on or after START (console and batch modes)')
+    parser.add_argument('--end', default=None, help='Only use rows dated before END (console and batch modes)')
+    parser.add_argument('--float32', action='store_true', help='Keep features, scaled data and the neighbor index in float32')
+    args = parser.parse_args()
+    dtype = np.float32 if args.float32 else np.float64
+    
+    if args.batch:
+        run_batch(args.batch, args.days, args.workers, args.start, args.end, dtype)
+    else:
+        main(use_gui=not args.console, start=args.start, end=args.end, dtype=dtype)
\ No newline at end of file
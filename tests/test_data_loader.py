@@ -0,0 +1,65 @@
+import os
+import numpy as np
+import pandas as pd
+import pytest
+
+from cryptopredictor.data import column_cache
+from cryptopredictor.data.data_loader import DataLoader
+
+DATA_FILE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'Crypto_currency.csv')
+APPEND_AT = 2300   # header and rows up to 2021-01-01 are cached, the rest of the file is appended
+
+def load(path=DATA_FILE, **kwargs):
+    loader = DataLoader(path, **kwargs)
+    loader.load_data()
+    loader.preprocess_data()
+    return loader
+
+
+@pytest.mark.parametrize('target', ['Close', 'Volume', 'Adj Close'])
+def test_split_data_builds_lags_for_any_numeric_target(target):
+    loader = load()
+    X_train, X_test, y_train, y_test, feature_columns = loader.split_data(target, shuffle=False)
+
+    lags = [f'{target}_t-{i}' for i in range(1, 4)]
+    assert feature_columns[:3] == lags
+    assert len(feature_columns) == len(set(feature_columns))
+    source = loader.data[target]
+    for i, name in enumerate(lags, start=1):
+        np.testing.assert_array_equal(X_train[name].to_numpy(), source.shift(i).loc[X_train.index].to_numpy())
+    np.testing.assert_array_equal(y_test.to_numpy(), source.loc[X_test.index].to_numpy())
+
+
+def test_split_data_names_supported_targets_for_unknown_ones():
+    loader = load()
+    with pytest.raises(ValueError, match="supported targets are"):
+        loader.split_data('MA_5')
+
+
+@pytest.mark.parametrize('kwargs', [{}, {'columns': ['Close', 'Volume']}, {'start': '2019-01-01', 'end': '2022-01-01'}])
+def test_rows_appended_to_a_cached_csv_load_like_an_uncached_file(tmp_path, capsys, kwargs):
+    # the cache is extended in place (.npy headers rewritten, features continued from their tails),
+    # the result must equal parsing the grown file from scratch
+    # the split comes after the file's null rows, appended floats could not go into an int Volume column
+    with open(DATA_FILE, newline='') as f:
+        lines = f.readlines()
+    source, cache_dir = str(tmp_path / 'prices.csv'), str(tmp_path / 'cache')
+    with open(source, 'w', newline='') as f:
+        f.writelines(lines[:APPEND_AT])
+    load(source, cache_dir=cache_dir, **kwargs)
+    with open(source, 'a', newline='') as f:
+        f.writelines(lines[APPEND_AT:])
+    assert column_cache.check(column_cache.cache_path(cache_dir, source), source)['state'] == 'appended'
+
+    capsys.readouterr()
+    cached = load(source, cache_dir=cache_dir, **kwargs)
+    output = capsys.readouterr().out
+    assert f'{len(lines) - APPEND_AT} new rows appended to the data cache' in output
+    if not kwargs.get('start'):
+        assert 'Features computed for' in output
+    expected = load(source, **kwargs)
+
+    pd.testing.assert_frame_equal(cached.data, expected.data, check_index_type=False)
+    assert list(cached.features.columns) == list(expected.features.columns)
+    np.testing.assert_array_equal(cached.features.index, expected.features.index)
+    np.testing.assert_array_equal(cached.features.values, expected.features.values)
@@ -0,0 +1,55 @@
+import os
+import numpy as np
+import pytest
+
+from cryptopredictor.data.data_loader import DataLoader
+from cryptopredictor.features.feature_processor import FeatureProcessor
+from cryptopredictor.forecaster.price_forecaster import PriceForecaster
+from cryptopredictor.model.knn_regressor import KNNRegressor
+
+DATA_FILE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'Crypto_currency.csv')
+
+# float32 keeps about 7 significant digits, predictions and forecasts must agree well inside that
+RTOL = 1e-5
+
+def fit_close_model(dtype):
+    # the single-asset pipeline for Close: load, features, shared split and scaling, k=5 model
+    loader = DataLoader(DATA_FILE, dtype=dtype)
+    loader.load_data()
+    loader.preprocess_data()
+    train, test = loader.split_features()
+    processor = FeatureProcessor()
+    train_scaled, test_scaled = processor.scale_matrix(train, test)
+
+    columns = loader.features.spec.columns_for('Close')
+    y = loader.target_values('Close')
+    model = KNNRegressor(k=5).fit(train_scaled.take(columns), y.loc[train.index].to_numpy())
+    predictions = model.predict(test_scaled.take(columns))
+    forecast = PriceForecaster().forecast(model, processor.for_columns(columns).scaler,
+                                          loader.get_last_days_data(), 5, 'Close', columns)
+    return model, predictions, np.asarray(forecast, dtype=np.float64)
+
+
+@pytest.fixture(scope='module')
+def fitted():
+    return {dtype: fit_close_model(dtype) for dtype in (np.float64, np.float32)}
+
+
+def test_float32_pipeline_stays_float32(fitted):
+    model, predictions, _ = fitted[np.float32]
+    assert model.X_train.dtype == np.float32
+    assert model.y_train.dtype == np.float32
+    assert predictions.dtype == np.float32
+
+
+def test_float32_predictions_match_float64(fitted):
+    _, expected, _ = fitted[np.float64]
+    _, actual, _ = fitted[np.float32]
+    np.testing.assert_allclose(actual, expected, rtol=RTOL)
+
+
+def test_float32_forecast_matches_float64(fitted):
+    _, _, expected = fitted[np.float64]
+    _, _, actual = fitted[np.float32]
+    assert len(actual) == 5
+    np.testing.assert_allclose(actual, expected, rtol=RTOL)